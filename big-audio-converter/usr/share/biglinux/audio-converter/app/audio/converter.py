@@ -278,7 +278,7 @@ class AudioConverter:
 
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,  # Output goes to file, never read
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 text=True,
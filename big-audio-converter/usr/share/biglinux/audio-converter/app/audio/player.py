@@ -94,6 +94,8 @@ class AudioPlayer:
                 vo="null",  # No video output
                 # Audio options
                 audio_display="no",  # Don't show audio visualization
+                # Keep pitch when the speed changes (matches self.pitch_correction)
+                audio_pitch_correction="yes",
                 # Performance
                 cache="yes",
                 demuxer_max_bytes="50M",
@@ -176,7 +178,7 @@ class AudioPlayer:
         elif loglevel == "info":
             logger.info(f"MPV [{component}]: {message}")
         else:
-            logger.debug(f"MPV [{component}]: {message}")
+            logger.debug("MPV [%s]: %s", component, message)
 
     def _position_update_callback(self):
         """Timer callback for position updates."""
@@ -380,7 +382,7 @@ class AudioPlayer:
             # Schedule seek for later
             delay_ms = int(self.seek_throttle_ms - time_since_last_seek)
             self.seek_timer_id = GLib.timeout_add(delay_ms, self._execute_pending_seek)
-            logger.debug(f"Throttling seek to {position:.3f}s, delayed by {delay_ms}ms")
+            logger.debug("Throttling seek to %.3fs, delayed by %sms", position, delay_ms)
             return True
 
         # Execute seek immediately
@@ -397,7 +399,7 @@ class AudioPlayer:
 
     def _do_seek(self, position):
         """Internal method to perform actual seek operation."""
-        logger.debug(f"Executing seek to position={position:.6f}s")
+        logger.debug("Executing seek to position=%.6fs", position)
 
         # Update last seek time
         self.last_seek_time = time.time() * 1000
@@ -451,7 +453,7 @@ class AudioPlayer:
             self.mpv_instance.seek(position, reference='absolute', precision='exact')
             
             self._position = position
-            logger.debug(f"Seek completed to {position:.3f}s")
+            logger.debug("Seek completed to %.3fs", position)
             
             # Restore playing state if needed
             if restore_playing:
@@ -496,7 +498,7 @@ class AudioPlayer:
     def set_volume(self, volume):
         """Set playback volume (0.0 to 5.0) - updates in real-time."""
         volume = max(0.0, min(volume, 5.0))
-        logger.debug(f"Setting volume to: {volume}")
+        logger.debug("Setting volume to: %s", volume)
 
         self.volume = volume
         try:
@@ -508,7 +510,7 @@ class AudioPlayer:
     def set_playback_speed(self, speed):
         """Set playback speed (0.5 to 5.0) - updates in real-time."""
         speed = max(0.5, min(speed, 5.0))
-        logger.debug(f"Setting playback speed to: {speed}")
+        logger.debug("Setting playback speed to: %s", speed)
 
         self.speed = speed
         try:
@@ -518,7 +520,7 @@ class AudioPlayer:
 
     def set_pitch_correction(self, enabled):
         """Enable or disable pitch correction when changing speed."""
-        logger.debug(f"Setting pitch correction to: {enabled}")
+        logger.debug("Setting pitch correction to: %s", enabled)
 
         self.pitch_correction = enabled
         try:
@@ -596,7 +598,7 @@ class AudioPlayer:
                 graph = ",".join(filters)
                 filter_string = f"lavfi=[{graph}]"
                 self.mpv_instance['af'] = filter_string
-                logger.debug(f"Audio filters applied: {filter_string}")
+                logger.debug("Audio filters applied: %s", filter_string)
             else:
                 logger.debug("All audio filters cleared")
         except Exception as e:
@@ -303,7 +303,7 @@ class SegmentProcessor:
             # Run FFmpeg command
             process = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,  # Output goes to file, never read
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=300,  # 5 minute timeout
@@ -363,7 +363,7 @@ class SegmentProcessor:
             logger.debug(f"Concatenating segments: {' '.join(cmd)}")
             process = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,  # Output goes to file, never read
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=300,  # 5 minute timeout
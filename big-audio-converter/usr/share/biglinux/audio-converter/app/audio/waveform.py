@@ -2,15 +2,24 @@
 Waveform generation module for audio visualization.
 """
 
+import hashlib
 import logging
 import os
 import subprocess
+import threading
+from collections import OrderedDict
 
 import numpy as np
 from gi.repository import GLib
 
 logger = logging.getLogger(__name__)
 
+PEAK_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "audio-converter",
+    "peaks",
+)
+
 
 class WaveformGenerator:
     """Encapsulates waveform generation with proper process lifecycle management."""
@@ -20,25 +29,43 @@ class WaveformGenerator:
     MAX_RATE = 44100
     MIN_RATE = 200
 
+    # Number of decoded waveforms kept in memory for the session
+    RESULT_CACHE_SIZE = 4
+    # Number of ffprobe durations remembered for the session
+    DURATION_CACHE_SIZE = 256
+    # Peaks stored per file in the on-disk cache (interleaved min/max pairs,
+    # float16: about 800 KB before compression)
+    DISK_CACHE_MAX_SAMPLES = 400_000
+    # Total size of the on-disk peak cache; least recently used files go first
+    DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
     def __init__(self):
         self._current_process = None
+        self._lock = threading.Lock()
+        self._inflight = set()
+        self._latest_path = None
+        # (file_path, mtime_ns, size) -> (waveform_data, target_rate, duration)
+        self._result_cache = OrderedDict()
+        # (actual_file_path, mtime_ns, size) -> duration in seconds
+        self._duration_cache = OrderedDict()
 
     def _cancel_current(self):
         """Cancel any running waveform generation process."""
-        if self._current_process is not None:
+        with self._lock:
+            process, self._current_process = self._current_process, None
+        if process is not None:
             try:
-                if self._current_process.poll() is None:
+                if process.poll() is None:
                     logger.info("Terminating previous waveform generation process")
-                    self._current_process.terminate()
+                    process.terminate()
                     try:
-                        self._current_process.wait(timeout=1.0)
+                        process.wait(timeout=1.0)
                     except subprocess.TimeoutExpired:
                         logger.warning("Previous process didn't terminate, killing it")
-                        self._current_process.kill()
-                        self._current_process.wait()
+                        process.kill()
+                        process.wait()
             except Exception as e:
                 logger.error(f"Error terminating previous process: {e}")
-            self._current_process = None
 
     def _resolve_path(self, file_path, track_metadata):
         """Resolve virtual track paths to actual file paths."""
@@ -54,7 +81,15 @@ class WaveformGenerator:
         return actual_file_path, audio_stream_index
 
     def _get_duration(self, ffprobe_path, actual_file_path):
-        """Get audio duration using ffprobe."""
+        """Get audio duration using ffprobe, reusing earlier probes of the file."""
+        st = os.stat(actual_file_path)
+        duration_key = (actual_file_path, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            duration = self._duration_cache.get(duration_key)
+            if duration is not None:
+                self._duration_cache.move_to_end(duration_key)
+                return duration
+
         probe_cmd = [
             ffprobe_path,
             "-v",
@@ -70,8 +105,173 @@ class WaveformGenerator:
         logger.info(
             f"ffprobe duration={duration:.6f}s for {os.path.basename(actual_file_path)}"
         )
+        with self._lock:
+            self._duration_cache[duration_key] = duration
+            while len(self._duration_cache) > self.DURATION_CACHE_SIZE:
+                self._duration_cache.popitem(last=False)
         return duration
 
+    def _cache_key(self, file_path, actual_file_path):
+        """Build a cache key that changes whenever the source file changes."""
+        st = os.stat(actual_file_path)
+        return (file_path, st.st_mtime_ns, st.st_size)
+
+    def _remember(self, cache_key, waveform_data, target_rate, duration):
+        """Store a finished waveform in the in-memory LRU."""
+        # Read-only so no consumer can alter what later cache hits serve
+        waveform_data.flags.writeable = False
+        with self._lock:
+            self._result_cache[cache_key] = (waveform_data, target_rate, duration)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _disk_cache_path(self, cache_key):
+        """Return the peak cache file for a cache key."""
+        digest = hashlib.blake2b(
+            "|".join(str(part) for part in cache_key).encode(), digest_size=20
+        ).hexdigest()
+        return os.path.join(PEAK_CACHE_DIR, f"{digest}.npz")
+
+    def _load_disk_cache(self, cache_key):
+        """Load a previously decoded waveform from disk, or return None."""
+        cache_path = self._disk_cache_path(cache_key)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                waveform_data = cached["peaks"].astype(np.float32)
+                target_rate = float(cached["rate"])
+                duration = float(cached["duration"])
+            # Mark the entry as recently used for pruning
+            os.utime(cache_path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable peak cache {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return None
+
+        return waveform_data, target_rate, duration
+
+    def _peaks_for_disk(self, waveform_data, target_rate):
+        """Reduce a waveform to at most DISK_CACHE_MAX_SAMPLES values.
+
+        Longer waveforms become interleaved (min, max) pairs per block. The
+        visualizer draws the min/max of the samples under each pixel, so the
+        envelope is unchanged down to the block size. Returns the peaks and
+        their effective sample rate.
+        """
+        if len(waveform_data) <= self.DISK_CACHE_MAX_SAMPLES:
+            return waveform_data.astype(np.float16), float(target_rate)
+
+        pair_count = self.DISK_CACHE_MAX_SAMPLES // 2
+        block = -(-len(waveform_data) // pair_count)  # ceiling division
+        blocks = waveform_data[: len(waveform_data) // block * block].reshape(-1, block)
+        peaks = np.empty(blocks.shape[0] * 2, dtype=np.float16)
+        peaks[0::2] = blocks.min(axis=1)
+        peaks[1::2] = blocks.max(axis=1)
+        return peaks, target_rate * 2.0 / block
+
+    def _save_disk_cache(self, cache_key, waveform_data, target_rate, duration):
+        """Write a waveform's peaks to the cache and prune old entries."""
+        cache_path = self._disk_cache_path(cache_key)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            peaks, peak_rate = self._peaks_for_disk(waveform_data, target_rate)
+            os.makedirs(PEAK_CACHE_DIR, mode=0o700, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, peaks=peaks, rate=peak_rate, duration=duration)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write peak cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        try:
+            self._prune_disk_cache()
+        except OSError as e:
+            logger.warning(f"Failed to prune peak cache: {e}")
+
+    def _prune_disk_cache(self):
+        """Delete least recently used peak files beyond DISK_CACHE_MAX_BYTES."""
+        entries = []
+        total = 0
+        with os.scandir(PEAK_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    # Another instance may prune the same directory
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= self.DISK_CACHE_MAX_BYTES:
+            return
+        # mtime is refreshed on every cache hit, so oldest means least used
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Already removed elsewhere; its space is freed all the same
+            total -= size
+            if total <= self.DISK_CACHE_MAX_BYTES:
+                break
+
+    def _is_stale(self, file_path):
+        """Return whether a newer request has replaced the one for file_path."""
+        with self._lock:
+            return self._latest_path != file_path
+
+    def _release_process(self, process):
+        """Forget the running decode, unless a newer job has replaced it."""
+        with self._lock:
+            if process is not None and self._current_process is process:
+                self._current_process = None
+
+    def _show_no_waveform(self, visualizer, file_path):
+        """Clear the visualizer after a failed request, unless superseded."""
+        if self._is_stale(file_path):
+            return
+        GLib.idle_add(
+            lambda: (
+                (visualizer.set_loading(False), visualizer.set_waveform(None, 0))
+                or False
+            )
+        )
+
+    def _show_waveform(
+        self, visualizer, waveform_data, target_rate, duration, file_path, file_markers
+    ):
+        """Hand a finished waveform to the visualizer on the main loop."""
+        # Results of superseded requests must not replace the newer file's
+        if self._is_stale(file_path):
+            logger.info(f"Dropping waveform of superseded request: {file_path}")
+            return
+        # A fresh payload per call: the visualizer owns the dict it is given,
+        # while the cached array is shared between calls
+        waveform_payload = {
+            "levels": [waveform_data],
+            "rates": [target_rate],
+            "zoom_thresholds": [1.0],
+        }
+
+        def update_visualizer():
+            visualizer.set_waveform(waveform_payload, duration)
+            if (
+                file_markers
+                and file_path in file_markers
+                and visualizer.markers_enabled
+            ):
+                visualizer.restore_markers(file_markers[file_path])
+            return False
+
+        GLib.idle_add(update_visualizer)
+
     def generate(
         self,
         file_path,
@@ -80,9 +280,29 @@ class WaveformGenerator:
         file_markers=None,
         zoom_control_box=None,
         track_metadata=None,
+    ):
+        """Generate waveform data, skipping requests already being decoded."""
+        with self._lock:
+            if file_path in self._inflight and self._latest_path == file_path:
+                logger.info(f"Waveform already in progress for {file_path}, skipping")
+                return
+            self._inflight.add(file_path)
+            self._latest_path = file_path
+
+        try:
+            self._generate(
+                file_path, converter_instance, visualizer, file_markers, track_metadata
+            )
+        finally:
+            with self._lock:
+                self._inflight.discard(file_path)
+
+    def _generate(
+        self, file_path, converter_instance, visualizer, file_markers, track_metadata
     ):
         """Generate waveform data using a dynamically-calculated resolution."""
         self._cancel_current()
+        process = None
 
         def set_loading():
             visualizer.set_loading(True, "Generating waveform...")
@@ -97,15 +317,21 @@ class WaveformGenerator:
 
             if not os.path.exists(actual_file_path):
                 logger.error(f"File not found: {actual_file_path}")
-                GLib.idle_add(
-                    lambda: (
-                        (
-                            visualizer.set_loading(False),
-                            visualizer.set_waveform(None, 0),
-                        )
-                        or False
-                    )
-                )
+                self._show_no_waveform(visualizer, file_path)
+                return
+
+            cache_key = self._cache_key(file_path, actual_file_path)
+            with self._lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is None:
+                cached = self._load_disk_cache(cache_key)
+                if cached is not None:
+                    self._remember(cache_key, *cached)
+            if cached is not None:
+                logger.info(f"Using cached waveform for: {actual_file_path}")
+                self._show_waveform(visualizer, *cached, file_path, file_markers)
                 return
 
             logger.info(f"Generating waveform for: {actual_file_path}")
@@ -116,15 +342,7 @@ class WaveformGenerator:
                 duration = self._get_duration(ffprobe_path, actual_file_path)
             except Exception as e:
                 logger.error(f"Failed to get duration: {e}")
-                GLib.idle_add(
-                    lambda: (
-                        (
-                            visualizer.set_loading(False),
-                            visualizer.set_waveform(None, 0),
-                        )
-                        or False
-                    )
-                )
+                self._show_no_waveform(visualizer, file_path)
                 return
 
             # Dynamic sample rate calculation
@@ -163,10 +381,17 @@ class WaveformGenerator:
                 "-",
             ])
 
+            # A newer request may have arrived while this job was probing;
+            # its _cancel_current() had no process of ours to stop yet
+            if self._is_stale(file_path):
+                logger.info(f"Skipping superseded waveform request: {file_path}")
+                return
+
             process = subprocess.Popen(
                 cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
-            self._current_process = process
+            with self._lock:
+                self._current_process = process
 
             chunk_size = 65536
             data_list = []
@@ -180,19 +405,13 @@ class WaveformGenerator:
                     data_list.append(chunk)
 
             process.wait()
-            self._current_process = None
+            self._release_process(process)
+            # A terminated decode only produced part of the file
+            decode_complete = process.returncode == 0
 
             if not data_list:
                 logger.error("No waveform data generated")
-                GLib.idle_add(
-                    lambda: (
-                        (
-                            visualizer.set_loading(False),
-                            visualizer.set_waveform(None, 0),
-                        )
-                        or False
-                    )
-                )
+                self._show_no_waveform(visualizer, file_path)
                 return
 
             waveform_data = np.concatenate(data_list)
@@ -205,15 +424,7 @@ class WaveformGenerator:
             ):
                 logger.error("Invalid waveform data")
                 del waveform_data
-                GLib.idle_add(
-                    lambda: (
-                        (
-                            visualizer.set_loading(False),
-                            visualizer.set_waveform(None, 0),
-                        )
-                        or False
-                    )
-                )
+                self._show_no_waveform(visualizer, file_path)
                 return
 
             max_val = np.max(np.abs(waveform_data))
@@ -225,34 +436,22 @@ class WaveformGenerator:
                 f"Generated {len(waveform_data)} samples ({total_size_kb:.1f} KB)"
             )
 
-            waveform_payload = {
-                "levels": [waveform_data],
-                "rates": [target_rate],
-                "zoom_thresholds": [1.0],
-            }
+            if decode_complete:
+                self._remember(cache_key, waveform_data, target_rate, duration)
 
-            def update_visualizer():
-                visualizer.set_waveform(waveform_payload, duration)
-                if (
-                    file_markers
-                    and file_path in file_markers
-                    and visualizer.markers_enabled
-                ):
-                    visualizer.restore_markers(file_markers[file_path])
-                return False
+            self._show_waveform(
+                visualizer, waveform_data, target_rate, duration, file_path, file_markers
+            )
 
-            GLib.idle_add(update_visualizer)
+            # Persist after handing the data to the UI so the write never
+            # delays the waveform appearing
+            if decode_complete:
+                self._save_disk_cache(cache_key, waveform_data, target_rate, duration)
 
         except Exception as e:
             logger.error(f"Error generating waveform: {str(e)}")
-            self._current_process = None
-
-            GLib.idle_add(
-                lambda: (
-                    (visualizer.set_loading(False), visualizer.set_waveform(None, 0))
-                    or False
-                )
-            )
+            self._release_process(process)
+            self._show_no_waveform(visualizer, file_path)
 
     def activate_without_waveform(
         self,
@@ -264,6 +463,8 @@ class WaveformGenerator:
         track_metadata=None,
     ):
         """Activate a file in the visualizer without generating waveform data."""
+        with self._lock:
+            self._latest_path = file_path
         try:
             actual_file_path, _ = self._resolve_path(file_path, track_metadata)
 
@@ -303,3 +504,4 @@ class WaveformGenerator:
 _generator = WaveformGenerator()
 generate = _generator.generate
 activate_without_waveform = _generator.activate_without_waveform
+cancel_current = _generator._cancel_current
@@ -21,61 +21,86 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import GLib
 
+from app.utils import config_keys
+
 logger = logging.getLogger(__name__)
 
+# The zoom slider runs 0-150 in 0.1 steps; precompute zoom = 10^(slider/50)
+# for every step so dragging indexes a table. Values stepped by the adjustment
+# carry float noise ((0.1 + 0.2) * 10 == 3.0000000000000004), so a value within
+# _ZOOM_STEP_EPSILON of a step counts as that step. Values between steps (e.g.
+# set back from a wheel zoom) still use pow() so the mapping stays continuous.
+_ZOOM_STEPS_PER_UNIT = 10
+_ZOOM_STEP_EPSILON = 1e-6
+_ZOOM_LUT = tuple(math.pow(10, i / 500.0) for i in range(1501))
+
 
 class ControlsBarMixin:
     """Mixin handling bottom controls bar interactions: zoom, volume, speed popovers and visualizer sync."""
 
     # --- Visualizer height ---
 
+    def _set_paned_position(self, paned, position):
+        """Move a paned handle, skipping the relayout when it is already there."""
+        if paned.get_position() != position:
+            paned.set_position(position)
+
     def _on_visualizer_height_changed(self, paned, param):
         """Handle visualizer height changes and save to config."""
-        if not hasattr(self.app, "config") or not self.app.config:
+        if not self._geometry_restored:
+            return
+        if not self._config:
             return
 
-        # Don't save position when cut is off (paned is in collapsed state)
-        if hasattr(self, "cut_row") and self.cut_row.get_selected() == 0:
+        # Don't save position when cut is off (paned is in collapsed state);
+        # cut_row exists by now, _restore_geometry has already read it
+        if self.cut_row.get_selected() == 0:
             return
 
         # Get total height and position
         total_height = self.get_height()
+        if total_height <= 0:
+            return  # Not allocated yet
         position = paned.get_position()
 
-        # Calculate visualizer height (accounting for margins, zoom control bar, and seekbar)
-        visualizer_height = (
-            total_height - position - 50 - 34
-        )  # 50px = 10px margin + 40px zoom controls; 34px = seekbar (28px + 6px margin)
+        # Space below the paned handle that isn't waveform:
+        # 50px = 10px margin + 40px zoom controls; 34px = seekbar (28px + 6px margin)
+        chrome_height = 50 + 34
+
+        # Calculate visualizer height
+        visualizer_height = total_height - position - chrome_height
 
         # Define minimum heights for both sections
         min_top_height = 200
         min_visualizer_height = 100
+        max_visualizer_height = total_height * 0.8
 
         # Make sure we don't resize the visualizer too small
         if visualizer_height < min_visualizer_height:
-            # Calculate the maximum valid position to maintain minimum visualizer height
-            max_position = total_height - min_visualizer_height - 50 - 34
-            # Adjust the position
-            paned.set_position(max_position)
-            # Recalculate visualizer height
+            # Keep the minimum visualizer height by moving the handle up
+            self._set_paned_position(
+                paned, total_height - min_visualizer_height - chrome_height
+            )
             visualizer_height = min_visualizer_height
 
         # Make sure we don't resize the top section too small (only check if visualizer constraint is satisfied)
         elif position < min_top_height:
             # Prevent the top section from getting too small
-            paned.set_position(min_top_height)
-            # Recalculate visualizer height
-            visualizer_height = total_height - min_top_height - 50 - 34
+            self._set_paned_position(paned, min_top_height)
+            visualizer_height = total_height - min_top_height - chrome_height
+
+        # Nothing to save when the paned reports the height we already have
+        if visualizer_height == self.visualizer_height:
+            return
 
         # Only save if it's a reasonable value
-        if (
-            visualizer_height >= min_visualizer_height
-            and visualizer_height <= total_height * 0.8
-        ):
+        if min_visualizer_height <= visualizer_height <= max_visualizer_height:
             # Update stored height
             self.visualizer_height = visualizer_height
-            # Save to config
-            self.app.config.set("visualizer_height", str(visualizer_height))
+            # Save to config once the drag settles
+            self._queue_geometry_save(
+                config_keys.VISUALIZER_HEIGHT, str(visualizer_height)
+            )
 
             # Visualizer height is managed by GTK Box layout via vexpand
 
@@ -83,15 +108,16 @@ class ControlsBarMixin:
 
     def _format_zoom_value(self, scale, value):
         """Format zoom slider value to show actual zoom level."""
-        # Convert linear slider value (0-100) to logarithmic zoom (1-100)
-        # Using formula: zoom = 10^(value/50) where value 0→1x, 50→10x, 100→100x
-        zoom = math.pow(10, value / 50.0)
-        return f"{zoom:.1f}x"
+        return f"{self._slider_to_zoom(value):.1f}x"
 
     def _slider_to_zoom(self, slider_value):
         """Convert slider position (0-150) to zoom level (1-1000) logarithmically."""
         # Formula: zoom = 10^(slider_value/50)
         # slider_value=0 → zoom=1, slider_value=50 → zoom=10, slider_value=100 → zoom=100, slider_value=150 → zoom=1000
+        scaled = slider_value * _ZOOM_STEPS_PER_UNIT
+        index = round(scaled)
+        if abs(scaled - index) < _ZOOM_STEP_EPSILON and 0 <= index < len(_ZOOM_LUT):
+            return _ZOOM_LUT[index]
         return math.pow(10, slider_value / 50.0)
 
     def _zoom_to_slider(self, zoom_level):
@@ -107,19 +133,17 @@ class ControlsBarMixin:
         zoom_level = self._slider_to_zoom(slider_value)
 
         # Update the zoom value label
-        if hasattr(self, "zoom_value_label"):
-            self.zoom_value_label.set_text(f"{zoom_level:.1f}x")
+        self.zoom_value_label.set_text(f"{zoom_level:.1f}x")
 
-        if hasattr(self.visualizer, "set_zoom_level"):
-            # Use the new set_zoom_level method which can use mouse position
-            self.visualizer.set_zoom_level(zoom_level, use_mouse_position=True)
+        # Zoom around the mouse position when it is over the waveform
+        self.visualizer.set_zoom_level(zoom_level, use_mouse_position=True)
 
-            # Notify zoom change (will be blocked if called from visualizer)
-            if self.visualizer.zoom_changed_callback:
-                self.visualizer.zoom_changed_callback(self.visualizer.zoom_level)
+        # Notify zoom change (will be blocked if called from visualizer)
+        if self.visualizer.zoom_changed_callback:
+            self.visualizer.zoom_changed_callback(self.visualizer.zoom_level)
 
         # Schedule auto-close of popover after user finishes adjusting
-        if hasattr(self, "_zoom_close_timer") and self._zoom_close_timer:
+        if self._zoom_close_timer:
             GLib.source_remove(self._zoom_close_timer)
         self._zoom_close_timer = GLib.timeout_add(1500, self._auto_close_zoom_popover)
 
@@ -131,13 +155,12 @@ class ControlsBarMixin:
     def _auto_close_zoom_popover(self):
         """Auto-close the zoom popover after inactivity."""
         self._zoom_close_timer = None
-        if hasattr(self, "zoom_popover"):
-            self.zoom_popover.popdown()
+        self.zoom_popover.popdown()
         return False  # Don't repeat
 
     def _cancel_zoom_hover_close(self):
         """Cancel pending hover close timer."""
-        if hasattr(self, "_zoom_hover_close_timer") and self._zoom_hover_close_timer:
+        if self._zoom_hover_close_timer:
             GLib.source_remove(self._zoom_hover_close_timer)
             self._zoom_hover_close_timer = None
 
@@ -159,7 +182,7 @@ class ControlsBarMixin:
         """Cancel close when mouse enters the popover."""
         self._cancel_zoom_hover_close()
         # Also cancel the scale-change auto-close timer
-        if hasattr(self, "_zoom_close_timer") and self._zoom_close_timer:
+        if self._zoom_close_timer:
             GLib.source_remove(self._zoom_close_timer)
             self._zoom_close_timer = None
 
@@ -173,8 +196,7 @@ class ControlsBarMixin:
     def _hover_close_zoom_popover(self):
         """Close the zoom popover after hover inactivity."""
         self._zoom_hover_close_timer = None
-        if hasattr(self, "zoom_popover"):
-            self.zoom_popover.popdown()
+        self.zoom_popover.popdown()
         return False
 
     # --- Volume popover ---
@@ -198,10 +220,7 @@ class ControlsBarMixin:
                 popover.popdown()
 
     def _cancel_volume_hover_close(self):
-        if (
-            hasattr(self, "_volume_hover_close_timer")
-            and self._volume_hover_close_timer
-        ):
+        if self._volume_hover_close_timer:
             GLib.source_remove(self._volume_hover_close_timer)
             self._volume_hover_close_timer = None
 
@@ -230,8 +249,7 @@ class ControlsBarMixin:
 
     def _hover_close_volume_popover(self):
         self._volume_hover_close_timer = None
-        if hasattr(self, "volume_popover"):
-            self.volume_popover.popdown()
+        self.volume_popover.popdown()
         return False
 
     def _on_volume_btn_clicked(self, button):
@@ -262,13 +280,12 @@ class ControlsBarMixin:
         if player_volume > 1.0:
             player_volume = 1.0 + (player_volume - 1.0) * 0.5
         self.player.set_volume(player_volume)
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("conversion_volume", str(volume))
+        self._save_volume(volume)
 
     # --- Speed popover ---
 
     def _cancel_speed_hover_close(self):
-        if hasattr(self, "_speed_hover_close_timer") and self._speed_hover_close_timer:
+        if self._speed_hover_close_timer:
             GLib.source_remove(self._speed_hover_close_timer)
             self._speed_hover_close_timer = None
 
@@ -297,8 +314,7 @@ class ControlsBarMixin:
 
     def _hover_close_speed_popover(self):
         self._speed_hover_close_timer = None
-        if hasattr(self, "speed_popover"):
-            self.speed_popover.popdown()
+        self.speed_popover.popdown()
         return False
 
     def _on_speed_btn_clicked(self, button):
@@ -319,25 +335,21 @@ class ControlsBarMixin:
         self.speed_spin.handler_unblock_by_func(self._on_speed_spin_changed)
         # Apply speed
         self.player.set_playback_speed(speed)
-        self.player.set_pitch_correction(True)
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("conversion_speed", str(speed))
+        self._save_speed(speed)
 
     # --- Visualizer/seekbar sync ---
 
     def _on_visualizer_zoom_changed(self, zoom_level):
         """Update zoom slider when zoom changes from visualizer (e.g. mouse wheel)."""
-        if hasattr(self, "zoom_scale"):
-            # Convert zoom level back to slider value
-            slider_value = self._zoom_to_slider(zoom_level)
-            # Temporarily block signal to avoid feedback loop
-            self.zoom_scale.handler_block_by_func(self._on_zoom_scale_changed)
-            self.zoom_scale.set_value(slider_value)
-            self.zoom_scale.handler_unblock_by_func(self._on_zoom_scale_changed)
+        # Convert zoom level back to slider value
+        slider_value = self._zoom_to_slider(zoom_level)
+        # Temporarily block signal to avoid feedback loop
+        self.zoom_scale.handler_block_by_func(self._on_zoom_scale_changed)
+        self.zoom_scale.set_value(slider_value)
+        self.zoom_scale.handler_unblock_by_func(self._on_zoom_scale_changed)
 
         # Update the zoom value label
-        if hasattr(self, "zoom_value_label"):
-            self.zoom_value_label.set_text(f"{zoom_level:.1f}x")
+        self.zoom_value_label.set_text(f"{zoom_level:.1f}x")
 
         # Sync seekbar viewport
         self.seekbar.set_zoom_viewport(
@@ -2,6 +2,7 @@
 File queue UI component for managing files to be converted.
 """
 
+import concurrent.futures
 import gettext
 import json
 import logging
@@ -23,6 +24,56 @@ from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
 logger = logging.getLogger(__name__)
 
+# Extensions accepted by the queue (lower case, with the leading dot)
+AUDIO_EXTENSIONS = frozenset(
+    {
+        ".mp3",
+        ".wav",
+        ".ogg",
+        ".flac",
+        ".m4a",
+        ".aac",
+        ".opus",
+        ".wma",
+        ".aiff",
+        ".ape",
+        ".alac",
+        ".dsd",
+        ".dsf",
+        ".mka",
+        ".oga",
+        ".spx",
+        ".tta",
+        ".wv",
+        ".eac3",  # Dolby Digital Plus / E-AC-3
+        ".ac3",  # Dolby Digital / AC-3
+        ".dts",  # DTS audio
+    }
+)
+
+# Video containers (their audio tracks can be converted)
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".m4v",
+        ".mpg",
+        ".mpeg",
+        ".3gp",
+        ".ogv",
+        ".ts",
+        ".mts",
+        ".m2ts",
+    }
+)
+
+MEDIA_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
 
 class FileQueueRow(Adw.ActionRow):
     """Row representing a file in the queue using Adwaita ActionRow."""
@@ -105,6 +156,9 @@ class FileQueueRow(Adw.ActionRow):
         # Store references for tooltip helper (will be accessed later)
         self._play_button = self.play_button
         self._remove_button = remove_button
+        self._title_label = None
+        # Set by FileQueue when the row is added, so realize needs no tree walk
+        self._tooltip_helper = None
 
     def _setup_context_menu(self):
         """Setup right-click context menu for the file row."""
@@ -176,22 +230,10 @@ class FileQueueRow(Adw.ActionRow):
 
         # Find and add tooltip to the title label
         title_label = find_title_label(self)
-        # Tooltip will be added via tooltip_helper if available
         self._title_label = title_label
-        
-        # Now apply tooltip to the title label if tooltip_helper exists
-        # Need to get tooltip_helper from file_queue parent
-        if title_label and hasattr(self, 'index'):
-            # Access file queue through callbacks to get tooltip_helper
-            parent = self.get_parent()
-            while parent and not isinstance(parent, Gtk.ListBox):
-                parent = parent.get_parent()
-            if parent:
-                file_queue = parent.get_parent()
-                while file_queue and not isinstance(file_queue, FileQueue):
-                    file_queue = file_queue.get_parent()
-                if file_queue and hasattr(file_queue, '_tooltip_helper') and file_queue._tooltip_helper:
-                    file_queue._tooltip_helper.add_tooltip(title_label, "right_click_options")
+
+        if title_label and self._tooltip_helper:
+            self._tooltip_helper.add_tooltip(title_label, "right_click_options")
 
     def _on_open_folder(self, action, param):
         """Open the folder containing the file."""
@@ -360,9 +402,7 @@ class FileQueueRow(Adw.ActionRow):
     def _on_show_info(self, action, param):
         """Show detailed information dialog about the file."""
         # Get parent window
-        widget = self.get_parent()
-        while widget and not isinstance(widget, Gtk.Window):
-            widget = widget.get_parent()
+        widget = self.get_root()
 
         # Handle virtual track paths
         is_video_track = "::" in self.file_path
@@ -713,48 +753,7 @@ class FileQueue(Gtk.Box):
 
     def _is_valid_media_file_quick(self, file_path):
         """Quick check if file is likely a media file by extension."""
-        ext = os.path.splitext(file_path)[1].lower()
-        valid_extensions = [
-            # Audio formats
-            ".mp3",
-            ".wav",
-            ".ogg",
-            ".flac",
-            ".m4a",
-            ".aac",
-            ".opus",
-            ".wma",
-            ".aiff",
-            ".ape",
-            ".alac",
-            ".dsd",
-            ".dsf",
-            ".mka",
-            ".oga",
-            ".spx",
-            ".tta",
-            ".wv",
-            ".eac3",  # Dolby Digital Plus / E-AC-3
-            ".ac3",  # Dolby Digital / AC-3
-            ".dts",  # DTS audio
-            # Video formats (can be converted to audio)
-            ".mp4",
-            ".mkv",
-            ".avi",
-            ".mov",
-            ".wmv",
-            ".flv",
-            ".webm",
-            ".m4v",
-            ".mpg",
-            ".mpeg",
-            ".3gp",
-            ".ogv",
-            ".ts",
-            ".mts",
-            ".m2ts",
-        ]
-        return ext in valid_extensions
+        return os.path.splitext(file_path)[1].lower() in MEDIA_EXTENSIONS
 
     def _is_video_file(self, file_path):
         """Check if file is a video file by extension.
@@ -765,25 +764,7 @@ class FileQueue(Gtk.Box):
         Returns:
             bool: True if file has video extension, False otherwise
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        video_extensions = [
-            ".mp4",
-            ".mkv",
-            ".avi",
-            ".mov",
-            ".wmv",
-            ".flv",
-            ".webm",
-            ".m4v",
-            ".mpg",
-            ".mpeg",
-            ".3gp",
-            ".ogv",
-            ".ts",
-            ".mts",
-            ".m2ts",
-        ]
-        return ext in video_extensions
+        return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
 
     def _get_audio_codec_extension(self, codec_name):
         """Map audio codec name to file extension.
@@ -840,10 +821,14 @@ class FileQueue(Gtk.Box):
                 file_path,
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            # Bytes output: json.loads decodes UTF-8 itself
+            result = subprocess.run(cmd, capture_output=True, timeout=10)
 
             if result.returncode != 0:
-                logger.error(f"ffprobe failed for {file_path}: {result.stderr}")
+                logger.error(
+                    f"ffprobe failed for {file_path}: "
+                    f"{result.stderr.decode(errors='replace')}"
+                )
                 return []
 
             # Parse JSON output
@@ -1036,11 +1021,52 @@ class FileQueue(Gtk.Box):
             logger.error(f"Error adding track entry: {e}")
             return False
 
-    def add_file(self, file_path):
+    def add_files(self, file_paths):
+        """Add several files as one batch and return how many were added.
+
+        Video audio tracks are probed first, so UI updates are only suspended
+        while rows are inserted. The duplicate check reuses one set of queued
+        paths instead of rescanning the queue per file.
+        """
+        file_paths = list(file_paths)
+        queued_paths = {os.path.abspath(p) for p in self.files if "::" not in p}
+
+        # Probe the audio tracks of new videos in parallel; add_file would
+        # otherwise run ffprobe for each one in turn on the UI thread
+        video_paths = [
+            p
+            for p in file_paths
+            if self._is_video_file(p)
+            and os.path.abspath(p) not in queued_paths
+            and os.path.isfile(p)
+        ]
+        tracks_by_path = {}
+        if len(video_paths) == 1:
+            tracks_by_path[video_paths[0]] = self._get_audio_tracks(video_paths[0])
+        elif video_paths:
+            workers = min(len(video_paths), os.cpu_count() or 1, 8)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                tracks_by_path = dict(
+                    zip(video_paths, pool.map(self._get_audio_tracks, video_paths))
+                )
+
+        added = 0
+        self.suspend_updates()
+        try:
+            for file_path in file_paths:
+                if self.add_file(file_path, queued_paths, tracks_by_path):
+                    added += 1
+        finally:
+            self.resume_updates()
+        return added
+
+    def add_file(self, file_path, queued_paths=None, tracks_by_path=None):
         """Add a file to the queue without blocking for metadata.
 
         If the file is a video with multiple audio tracks, each track will be added
-        as a separate item in the queue.
+        as a separate item in the queue. queued_paths is the set of normalized
+        paths already queued; add_files passes one in to share it across a batch,
+        along with any audio tracks it has already probed in tracks_by_path.
         """
         try:
             # Check file existence
@@ -1055,16 +1081,14 @@ class FileQueue(Gtk.Box):
             # Normalize path for comparison
             normalized_path = os.path.abspath(file_path)
 
-            # Check if file is already in queue
-            for existing_file in self.files:
-                # Skip track entries (they contain ::)
-                if "::" in existing_file:
-                    continue
-                if os.path.abspath(existing_file) == normalized_path:
-                    logger.debug(
-                        f"File already in queue: {os.path.basename(file_path)}"
-                    )
-                    return False
+            # Check if file is already in queue (track entries contain ::)
+            if queued_paths is None:
+                queued_paths = {
+                    os.path.abspath(p) for p in self.files if "::" not in p
+                }
+            if normalized_path in queued_paths:
+                logger.debug(f"File already in queue: {os.path.basename(file_path)}")
+                return False
 
             # Check if queue was empty before adding
             was_empty = len(self.files) == 0
@@ -1072,7 +1096,9 @@ class FileQueue(Gtk.Box):
             # Check if this is a video file with multiple audio tracks
             if self._is_video_file(file_path):
                 logger.info(f"Detected video file: {os.path.basename(file_path)}")
-                tracks = self._get_audio_tracks(file_path)
+                tracks = (tracks_by_path or {}).get(file_path)
+                if tracks is None:
+                    tracks = self._get_audio_tracks(file_path)
 
                 if len(tracks) > 1:
                     # Multiple tracks - add each as separate entry
@@ -1108,6 +1134,7 @@ class FileQueue(Gtk.Box):
             # Regular file handling (audio files or single-track videos)
             # Add to the internal file list
             self.files.append(file_path)
+            queued_paths.add(normalized_path)
             file_index = len(self.files) - 1
 
             # Create row
@@ -1275,15 +1302,7 @@ class FileQueue(Gtk.Box):
     def on_delete_file(self, index, file_path):
         """Delete a file permanently with confirmation dialog."""
         # Get parent window for dialog
-        parent = self._parent_window
-        if not parent:
-            # Try to find the parent window
-            widget = self.get_parent()
-            while widget:
-                if isinstance(widget, Gtk.Window):
-                    parent = widget
-                    break
-                widget = widget.get_parent()
+        parent = self._parent_window or self.get_root()
 
         # Create confirmation dialog
         filename = os.path.basename(file_path)
@@ -1417,6 +1436,14 @@ class FileQueue(Gtk.Box):
         """Get all files in the queue."""
         return self.files.copy()
 
+    def get_files_view(self):
+        """Get the queue's own file list without copying.
+
+        The returned list must not be modified and is only valid until the
+        queue changes; use get_files() when a stable snapshot is needed.
+        """
+        return self.files
+
     def has_files(self):
         """Check if there are any files in the queue."""
         return len(self.files) > 0
@@ -1536,11 +1563,8 @@ class FileQueue(Gtk.Box):
 
         file_list = value
         if file_list:
-            for file in file_list:
-                if hasattr(file, "get_path"):
-                    file_path = file.get_path()
-                    if file_path:
-                        self.add_file(file_path)
+            file_paths = [f.get_path() for f in file_list if hasattr(f, "get_path")]
+            self.add_files(path for path in file_paths if path)
             return True
         return False
 
@@ -1660,9 +1684,12 @@ class FileQueue(Gtk.Box):
 
     def _apply_row_tooltips(self, row):
         """Apply custom tooltips to a file queue row."""
-        if not hasattr(self, '_tooltip_helper') or not self._tooltip_helper:
+        if not self._tooltip_helper:
             return
-        
+
+        # Remember the helper so the row can tooltip its title once realized
+        row._tooltip_helper = self._tooltip_helper
+
         # Apply tooltip to play button
         if hasattr(row, '_play_button'):
             self._tooltip_helper.add_tooltip(row._play_button, "play_this_file")
@@ -11,8 +11,10 @@ import gi
 gettext.textdomain("big-audio-converter")
 _ = gettext.gettext
 import logging
+import operator
 import os
 import threading
+import time
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
@@ -20,14 +22,144 @@ from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
 from app.ui.controls_bar_mixin import ControlsBarMixin
 from app.ui.equalizer_panel import EqualizerPanel
-from app.ui.file_queue import FileQueue
+from app.ui.file_queue import MEDIA_EXTENSIONS, FileQueue
 from app.ui.playback_controller import PlaybackControllerMixin
 from app.ui.settings_mixin import SettingsManagerMixin
 from app.ui.visualizer import AudioVisualizer, SeekBar
+from app.utils import config_keys
+from app.utils.config import is_true
 from app.utils.tooltip_helper import TooltipHelper
 
 logger = logging.getLogger(__name__)
 
+# Window title, also shown in the sidebar header
+APP_TITLE = _("Audio Converter")
+
+# One case-insensitive glob per queue-accepted extension, e.g. "*.[mM][pP]3"
+MEDIA_FILE_PATTERNS = tuple(
+    "*." + "".join(f"[{c}{c.upper()}]" if c.isalpha() else c for c in ext[1:])
+    for ext in sorted(MEDIA_EXTENSIONS)
+)
+
+# Main menu model; its items are app actions, so every window shares it
+_APP_MENU = Gio.Menu()
+_APP_MENU.append(_("Show help on hover"), "app.toggle-tips")
+_APP_MENU.append(_("Show Welcome Screen"), "app.show-welcome")
+_APP_MENU.append(_("About"), "app.about")
+
+# Config values read once when a window is built
+_LAYOUT_KEYS = (
+    config_keys.WINDOW_WIDTH,
+    config_keys.WINDOW_HEIGHT,
+    config_keys.WINDOW_MAXIMIZED,
+    config_keys.SIDEBAR_WIDTH,
+    config_keys.VISUALIZER_HEIGHT,
+)
+
+# Sidebar and dark controls bar styling, registered once per display
+_CSS = b"""
+.sidebar {
+    background-color: @sidebar_bg_color;
+}
+.dark-bottom-panel {
+    background-color: #1a1a1e;
+}
+.dark-controls-bar {
+    background-color: #2a2a30;
+    padding: 6px 15px;
+    border-bottom: 1px solid rgba(255,255,255,0.08);
+}
+.dark-controls-bar label {
+    color: rgba(255, 255, 255, 0.75);
+}
+.dark-controls-bar button {
+    color: rgba(255, 255, 255, 0.85);
+    background: none;
+    box-shadow: none;
+    border: none;
+}
+.dark-controls-bar button:hover {
+    color: #ffffff;
+    background-color: rgba(255, 255, 255, 0.1);
+}
+.dark-controls-bar button:active,
+.dark-controls-bar button:checked {
+    color: rgba(255, 255, 255, 0.95);
+    background-color: alpha(@accent_bg_color, 0.5);
+}
+.dark-controls-bar scale trough {
+    background-color: rgba(255, 255, 255, 0.12);
+}
+.dark-controls-bar scale highlight {
+    background-color: @accent_bg_color;
+}
+.dark-controls-bar scale slider {
+    background-color: rgba(255, 255, 255, 0.85);
+}
+.dark-controls-bar scale value {
+    color: rgba(255, 255, 255, 0.75);
+}
+popover.dark-popover {
+    background: none;
+    border: none;
+    box-shadow: none;
+    padding: 0;
+}
+popover.dark-popover > contents {
+    background-color: #2a2a30;
+    color: rgba(255, 255, 255, 0.85);
+    border: 1px solid rgba(255, 255, 255, 0.15);
+    border-radius: 12px;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.4);
+}
+popover.dark-popover > arrow {
+    background-color: #2a2a30;
+    border-color: rgba(255, 255, 255, 0.15);
+}
+popover.dark-popover label {
+    color: rgba(255, 255, 255, 0.85);
+}
+popover.dark-popover scale trough {
+    background-color: rgba(255, 255, 255, 0.25);
+    min-width: 10px;
+    min-height: 10px;
+    border-radius: 5px;
+}
+popover.dark-popover scale highlight {
+    background-color: @accent_bg_color;
+    min-width: 10px;
+    min-height: 10px;
+    border-radius: 5px;
+}
+popover.dark-popover scale slider {
+    background-color: rgba(255, 255, 255, 0.9);
+    min-width: 20px;
+    min-height: 20px;
+    border-radius: 10px;
+}
+popover.dark-popover scale indicator {
+    background-color: rgba(255, 255, 255, 0.3);
+    min-width: 6px;
+    min-height: 1px;
+}
+"""
+
+_css_loaded = False
+
+
+def _ensure_css():
+    global _css_loaded
+    if _css_loaded:
+        return
+    provider = Gtk.CssProvider()
+    provider.load_from_data(_CSS, -1)
+    Gtk.StyleContext.add_provider_for_display(
+        Gdk.Display.get_default(),
+        provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
+    _css_loaded = True
+
 
 class HeaderBar(Gtk.Box):
     """
@@ -50,11 +182,9 @@ class HeaderBar(Gtk.Box):
         self.header_bar.set_show_title(True)
 
         # Configure decoration layout based on window button position
-        # Configure decoration layout based on window button position
-        if not window_buttons_left:
-            self.header_bar.set_decoration_layout(":minimize,maximize,close")
-        else:
-            self.header_bar.set_decoration_layout("")
+        self.header_bar.set_decoration_layout(
+            "" if window_buttons_left else ":minimize,maximize,close"
+        )
 
         # Add the HeaderBar to this box
         self.append(self.header_bar)
@@ -64,32 +194,29 @@ class HeaderBar(Gtk.Box):
 
     def _create_ui_elements(self):
         # Always create queue controls
-        self.clear_queue_button = Gtk.Button()
+        self.clear_queue_button = Gtk.Button(
+            css_classes=["flat", "circular", "destructive-action"]
+        )
         self.clear_queue_button.set_icon_name("edit-delete-symbolic")
-        self.clear_queue_button.add_css_class("flat")
-        self.clear_queue_button.add_css_class("circular")
         self.clear_queue_button.set_valign(Gtk.Align.CENTER)
         self.clear_queue_button.connect("clicked", self.main_window.on_clear_queue)
-        self.clear_queue_button.add_css_class("destructive-action")
         self.clear_queue_button.set_visible(False)
         self.clear_queue_button.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Clear queue")],
         )
 
-        self.queue_size_label = Gtk.Label(label=_("0 files"))
-        self.queue_size_label.add_css_class("caption")
-        self.queue_size_label.add_css_class("dim-label")
+        self.queue_size_label = Gtk.Label(
+            label=_("0 files"), css_classes=["caption", "dim-label"]
+        )
         self.queue_size_label.set_visible(False)
         self.queue_size_label.set_margin_start(4)
         self.queue_size_label.set_margin_end(8)
         self.queue_size_label.set_valign(Gtk.Align.CENTER)
 
         # Create menu button
-        menu = Gio.Menu()
-        menu.append(_("Show help on hover"), "app.toggle-tips")
-        menu.append(_("Show Welcome Screen"), "app.show-welcome")
-        menu.append(_("About"), "app.about")
-        menu_button = Gtk.MenuButton(icon_name="open-menu-symbolic", menu_model=menu)
+        menu_button = Gtk.MenuButton(
+            icon_name="open-menu-symbolic", menu_model=_APP_MENU
+        )
         menu_button.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Main menu")],
         )
@@ -98,9 +225,7 @@ class HeaderBar(Gtk.Box):
         tips_enabled = True
         app = self.main_window.app
         if hasattr(app, "config") and app.config:
-            tips_enabled = (
-                app.config.get("show_mouseover_tips", "true").lower() == "true"
-            )
+            tips_enabled = app.config.get_bool("show_mouseover_tips", True)
         tips_action = Gio.SimpleAction.new_stateful(
             "toggle-tips", None, GLib.Variant.new_boolean(tips_enabled)
         )
@@ -167,8 +292,18 @@ class MainWindow(
     PlaybackControllerMixin,
     Adw.ApplicationWindow,
 ):
+    # button-layout is read once per process; every window shares the answer
+    _button_layout_cache = None
+
     def _window_buttons_on_left(self):
         """Detect if window buttons (close/min/max) are on the left side."""
+        if MainWindow._button_layout_cache is None:
+            MainWindow._button_layout_cache = self._read_button_layout()
+        return MainWindow._button_layout_cache
+
+    @staticmethod
+    def _read_button_layout():
+        """Query GSettings for the window button side (True means left)."""
         try:
             settings = Gio.Settings.new("org.gnome.desktop.wm.preferences")
             layout = settings.get_string("button-layout")
@@ -201,37 +336,40 @@ class MainWindow(
         default_height = 800
         is_maximized = False
 
-        # Try to load saved window state
+        # Read every stored layout value in one pass
+        saved_layout = {}
         if hasattr(kwargs.get("application", None), "config"):
             config = kwargs.get("application").config
             if config:
-                # Load window size from config
-                saved_width = config.get("window_width")
-                if saved_width:
-                    try:
-                        loaded_width = int(saved_width)
-                        # Ensure width is not smaller than minimum
-                        default_width = max(loaded_width, 920)
-                    except (ValueError, TypeError):
-                        pass
-
-                saved_height = config.get("window_height")
-                if saved_height:
-                    try:
-                        loaded_height = int(saved_height)
-                        # Ensure height is not smaller than minimum
-                        default_height = max(loaded_height, 600)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Load window maximized state from config
-                saved_maximized = config.get("window_maximized")
-                if saved_maximized:
-                    is_maximized = saved_maximized.lower() == "true"
+                saved_layout = config.get_many(_LAYOUT_KEYS)
+
+        # Load window size from config
+        saved_width = saved_layout.get(config_keys.WINDOW_WIDTH)
+        if saved_width:
+            try:
+                loaded_width = int(saved_width)
+                # Ensure width is not smaller than minimum
+                default_width = max(loaded_width, 920)
+            except (ValueError, TypeError):
+                pass
+
+        saved_height = saved_layout.get(config_keys.WINDOW_HEIGHT)
+        if saved_height:
+            try:
+                loaded_height = int(saved_height)
+                # Ensure height is not smaller than minimum
+                default_height = max(loaded_height, 600)
+            except (ValueError, TypeError):
+                pass
+
+        # Load window maximized state from config
+        saved_maximized = saved_layout.get(config_keys.WINDOW_MAXIMIZED)
+        if saved_maximized:
+            is_maximized = is_true(saved_maximized)
 
         # Initialize with loaded or default size
         super().__init__(
-            title=_("Audio Converter"),
+            title=APP_TITLE,
             default_width=default_width,
             default_height=default_height,
             **kwargs,
@@ -243,14 +381,14 @@ class MainWindow(
         # Set minimum window size to prevent controls from being cut off
         # Left sidebar (300px) + right content (620px) = 920px minimum width
         self.set_size_request(920, 600)
-        # For debouncing window size save
-        self._size_save_timeout_id = None
 
         self.app = kwargs.get("application")
+        # Resolved once so signal handlers need not probe the application
+        self._config = getattr(self.app, "config", None)
 
         # Initialize tooltip helper
-        if hasattr(self.app, "config") and self.app.config:
-            self.tooltip_helper = TooltipHelper(self.app.config)
+        if self._config:
+            self.tooltip_helper = TooltipHelper(self._config)
         else:
             self.tooltip_helper = None
 
@@ -259,6 +397,8 @@ class MainWindow(
         self.converter = self.app.converter
         # Add marker cache to remember markers for each file
         self.file_markers = {}  # Dictionary mapping file path to marker pairs
+        # file path -> ((start, stop) pairs, list stored in file_markers)
+        self._saved_marker_state = {}
 
         # Track if copy mode info dialog has been shown (show only once per session)
         self._copy_info_shown = False
@@ -269,6 +409,10 @@ class MainWindow(
         # Selection playback tracking
         self._playing_selection = False
         self._selection_segments = []  # List of (start, stop) tuples
+        # Time-sorted lookup tables kept by _load_selection_segments
+        self._segment_order = []
+        self._segment_starts = []
+        self._segment_reach = []
         self._current_segment_index = 0
         self._play_selection_mode = False  # Whether switch is on
         self._segment_seek_in_progress = False  # Prevent seek loops
@@ -277,9 +421,13 @@ class MainWindow(
         self._is_transitioning_segment = (
             False  # Lock to prevent transition race conditions
         )
+        self._end_of_track_handled = False  # Auto-next fired for this track
+        self._end_threshold = float("inf")  # duration - 0.2 once known
 
-        # For debouncing sidebar width save
-        self._sidebar_save_timeout_id = None
+        # Layout values (sidebar width, visualizer height, maximized) waiting
+        # to be written together once resizing settles
+        self._pending_geometry = {}
+        self._geometry_flush_armed = False
 
         # Default sidebar width - will be overridden by saved value if available
         self.sidebar_width = 380
@@ -287,27 +435,34 @@ class MainWindow(
         # Default visualizer height - will be overridden by saved value
         self.visualizer_height = 132
 
+        # Last volume/speed strings written to config
+        self._last_saved_volume_str = None
+        self._last_saved_speed_str = None
+        # Debounced volume/speed saves and the values they will write
+        self._volume_save_timer = None
+        self._speed_save_timer = None
+        self._pending_volume = None
+        self._pending_speed = None
+
         # Try to load saved sidebar width
-        if hasattr(self.app, "config") and self.app.config:
-            # Fix: match the parameter pattern used in the save method
-            saved_width = self.app.config.get("sidebar_width")
-            if saved_width:
-                try:
-                    self.sidebar_width = int(saved_width)
-                    if self.sidebar_width < 150:  # Ensure minimum width
-                        self.sidebar_width = 150
-                except (ValueError, TypeError):
-                    pass  # Use default if conversion fails
-
-            # Load saved visualizer height
-            saved_height = self.app.config.get("visualizer_height")
-            if saved_height:
-                try:
-                    self.visualizer_height = int(saved_height)
-                    if self.visualizer_height < 100:  # Ensure minimum height
-                        self.visualizer_height = 100
-                except (ValueError, TypeError):
-                    pass  # Use default if conversion fails
+        saved_width = saved_layout.get(config_keys.SIDEBAR_WIDTH)
+        if saved_width:
+            try:
+                self.sidebar_width = int(saved_width)
+                if self.sidebar_width < 150:  # Ensure minimum width
+                    self.sidebar_width = 150
+            except (ValueError, TypeError):
+                pass  # Use default if conversion fails
+
+        # Load saved visualizer height
+        saved_height = saved_layout.get(config_keys.VISUALIZER_HEIGHT)
+        if saved_height:
+            try:
+                self.visualizer_height = int(saved_height)
+                if self.visualizer_height < 100:  # Ensure minimum height
+                    self.visualizer_height = 100
+            except (ValueError, TypeError):
+                pass  # Use default if conversion fails
 
         # Ensure sidebar width doesn't violate right pane minimum (620px)
         # We use default_width (which is at least 920) to calculate safe sidebar width
@@ -321,16 +476,42 @@ class MainWindow(
         # Add property to track the last manually set sidebar width
         self._manual_sidebar_width = self.sidebar_width
 
+        # Widgets and state filled in later; handlers test them against None
+        self.visualizer = None
+        self.zoom_control_box = None
+        self.progress_dialog = None
+        # Worker pool for waveform decoding, created on first use
+        self._bg_pool = None
+        self._waveform_future = None
+        # Throttled conversion progress, reset by on_convert
+        self._pending_progress = None
+        self._progress_timer_id = None
+        # File-dialog filters, built on the first "Add Files" click
+        self._file_filters = None
+        self._media_filter = None
+        # Cursors toggled by _set_busy_cursor around file imports
+        self._cursor_wait = Gdk.Cursor.new_from_name("wait", None)
+        self._cursor_default = Gdk.Cursor.new_from_name("default", None)
+        # Store the currently active audio ID
+        self.active_audio_id = None
+
         # Set up GUI first, creating the visualizer
         self.setup_ui()
         self.setup_drop_target()
         self.connect("close-request", self.on_close_request)
 
-        # Setup visualizer tooltip after UI is fully created
-        if self.tooltip_helper and hasattr(self, "visualizer"):
-            GLib.idle_add(self._setup_visualizer_tooltip)
+        # Last (has_files, has_multiple_files, cut_enabled) applied to the UI
+        self._queue_visibility_state = None
+
+        # Confirmation dialog for clearing the queue, built on first use
+        self._clear_queue_dialog = None
 
-        # Connect to map event for visualizer height restoration
+        # Connect to map event for visualizer height restoration; paned
+        # position changes before the restore are layout noise, not user drags
+        self._geometry_restored = False
+        self._geometry_restore_id = None
+        self._geometry_restore_attempts = 0
+        self._surface_layout_id = None
         self.connect("map", self.on_window_mapped)
 
         # Connect window state signals (only maximized, save size on close only)
@@ -342,15 +523,15 @@ class MainWindow(
         self.player.connect("state-changed", self.on_player_state_changed)
         self.player.connect("eos", self.on_playback_finished)
 
-        # Restore maximized state after window is fully initialized
+        # Restore maximized state; GTK applies it when the window is first mapped
         if self._should_maximize:
-            GLib.timeout_add(100, self.maximize)
+            self.maximize()
 
         # Connect file removal signal
         self.file_queue.connect_file_removed_signal(self._on_file_removed)
 
-        # Store the currently active audio ID
-        self.active_audio_id = None
+        # Resolve the file queue entry point once for the drop path
+        self._fq_add_file = self.file_queue.add_file
 
         # Setup window-level keyboard shortcuts
         self._setup_keyboard_shortcuts()
@@ -378,143 +559,37 @@ class MainWindow(
 
     def setup_ui(self):
         """Set up the user interface."""
-        # Create main vertical paned container (root content)
-        self.vertical_paned = Gtk.Paned(orientation=Gtk.Orientation.VERTICAL)
+        # Static containers pass their properties to the constructor so
+        # GObject sets them in one call instead of one setter call each
+
+        # Create main vertical paned container (root content).
+        # Bottom controls must not be cut off when the window is resized.
+        self.vertical_paned = Gtk.Paned(
+            orientation=Gtk.Orientation.VERTICAL,
+            vexpand=True,
+            shrink_end_child=False,
+            resize_start_child=True,
+            resize_end_child=False,
+        )
         self.set_content(self.vertical_paned)
-        self.vertical_paned.set_vexpand(True)
-
-        # Prevent bottom controls from being cut off when window is resized
-        self.vertical_paned.set_shrink_end_child(False)
-        self.vertical_paned.set_resize_start_child(True)
-        self.vertical_paned.set_resize_end_child(False)
 
-        # Create a split view that allows resizing with the mouse (for sidebar and content)
-        self.split_view = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL)
-        self.split_view.set_position(self.sidebar_width)
-        self.split_view.set_vexpand(True)
-
-        # Prevent panes from shrinking below their minimum size
-        self.split_view.set_shrink_start_child(False)
-        self.split_view.set_shrink_end_child(False)
+        # Create a split view that allows resizing with the mouse (for sidebar
+        # and content); neither pane may shrink below its minimum size
+        self.split_view = Gtk.Paned(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            position=self.sidebar_width,
+            vexpand=True,
+            shrink_start_child=False,
+            shrink_end_child=False,
+        )
 
         # Add split_view directly to vertical_paned (top part)
         self.vertical_paned.set_start_child(self.split_view)
 
-        # Create CSS for sidebar styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(
-            b"""
-        .sidebar {
-            background-color: @sidebar_bg_color;
-        }
-        .dark-bottom-panel {
-            background-color: #1a1a1e;
-        }
-        .dark-controls-bar {
-            background-color: #2a2a30;
-            padding: 6px 15px;
-            border-bottom: 1px solid rgba(255,255,255,0.08);
-        }
-        .dark-controls-bar label {
-            color: rgba(255, 255, 255, 0.75);
-        }
-        .dark-controls-bar button {
-            color: rgba(255, 255, 255, 0.85);
-            background: none;
-            box-shadow: none;
-            border: none;
-        }
-        .dark-controls-bar button:hover {
-            color: #ffffff;
-            background-color: rgba(255, 255, 255, 0.1);
-        }
-        .dark-controls-bar button:active,
-        .dark-controls-bar button:checked {
-            color: rgba(255, 255, 255, 0.95);
-            background-color: alpha(@accent_bg_color, 0.5);
-        }
-        .dark-controls-bar scale trough {
-            background-color: rgba(255, 255, 255, 0.12);
-        }
-        .dark-controls-bar scale highlight {
-            background-color: @accent_bg_color;
-        }
-        .dark-controls-bar scale slider {
-            background-color: rgba(255, 255, 255, 0.85);
-        }
-        .dark-controls-bar scale value {
-            color: rgba(255, 255, 255, 0.75);
-        }
-        popover.dark-popover {
-            background: none;
-            border: none;
-            box-shadow: none;
-            padding: 0;
-        }
-        popover.dark-popover > contents {
-            background-color: #2a2a30;
-            color: rgba(255, 255, 255, 0.85);
-            border: 1px solid rgba(255, 255, 255, 0.15);
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.4);
-        }
-        popover.dark-popover > arrow {
-            background-color: #2a2a30;
-            border-color: rgba(255, 255, 255, 0.15);
-        }
-        popover.dark-popover label {
-            color: rgba(255, 255, 255, 0.85);
-        }
-        popover.dark-popover scale trough {
-            background-color: rgba(255, 255, 255, 0.25);
-            min-width: 10px;
-            min-height: 10px;
-            border-radius: 5px;
-        }
-        popover.dark-popover scale highlight {
-            background-color: @accent_bg_color;
-            min-width: 10px;
-            min-height: 10px;
-            border-radius: 5px;
-        }
-        popover.dark-popover scale slider {
-            background-color: rgba(255, 255, 255, 0.9);
-            min-width: 20px;
-            min-height: 20px;
-            border-radius: 10px;
-        }
-        popover.dark-popover scale indicator {
-            background-color: rgba(255, 255, 255, 0.3);
-            min-width: 6px;
-            min-height: 1px;
-        }
-        """,
-            -1,
-        )
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+        # Sidebar and dark controls bar styling (shared by all windows)
+        _ensure_css()
 
-        # Prepare queue controls, but only add to one headerbar (never both)
         window_buttons_left = self._window_buttons_on_left()
-        self.clear_queue_button = Gtk.Button()
-        self.clear_queue_button.set_icon_name("trash-symbolic")
-        self.clear_queue_button.add_css_class("circular")
-        self.clear_queue_button.connect("clicked", self.on_clear_queue)
-        self.clear_queue_button.add_css_class("destructive-action")
-        self.clear_queue_button.set_visible(False)  # Initially hidden
-        self.clear_queue_button.update_property(
-            [Gtk.AccessibleProperty.LABEL], [_("Clear queue")],
-        )
-        self.header_queue_size_label = Gtk.Label(label=_("0 files"))
-        self.header_queue_size_label.add_css_class("caption")
-        self.header_queue_size_label.add_css_class("dim-label")
-        self.header_queue_size_label.set_visible(False)
-        self.header_queue_size_label.set_margin_start(4)
-        self.header_queue_size_label.set_margin_end(8)
-        self.header_queue_size_label.set_valign(Gtk.Align.CENTER)
 
         # LEFT SIDE - Now contains conversion options (previously on right)
         left_box = Adw.ToolbarView()
@@ -543,7 +618,7 @@ class MainWindow(
             # Do not expand icon
             app_icon.set_hexpand(False)
             center_box.set_start_widget(app_icon)
-            title_label = Gtk.Label(label=_("Audio Converter"))
+            title_label = Gtk.Label(label=APP_TITLE)
             title_label.set_halign(Gtk.Align.CENTER)
             title_label.set_valign(Gtk.Align.START)
             title_label.set_hexpand(True)
@@ -552,7 +627,7 @@ class MainWindow(
             left_header.set_title_widget(center_box)
         else:
             title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-            title_label = Gtk.Label(label=_("Audio Converter"))
+            title_label = Gtk.Label(label=APP_TITLE)
             title_box.append(title_label)
             # Add an expanding box to push controls to the left
             expander = Gtk.Box()
@@ -562,18 +637,22 @@ class MainWindow(
         left_box.add_top_bar(left_header)
 
         # Create scrollable container for left content
-        left_scroll = Gtk.ScrolledWindow()
-        left_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        left_scroll.set_vexpand(True)
+        left_scroll = Gtk.ScrolledWindow(
+            hscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vexpand=True,
+        )
 
         # Create left content container
-        left_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        left_content.add_css_class("sidebar")
+        left_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, css_classes=["sidebar"]
+        )
         left_scroll.set_child(left_content)
 
         # Create middle container for conversion options (moved from right)
-        middle_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        middle_container.set_valign(Gtk.Align.FILL)
+        middle_container = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, valign=Gtk.Align.FILL
+        )
         left_content.append(middle_container)
 
         # Add conversion options to middle container (this stays the same)
@@ -598,15 +677,19 @@ class MainWindow(
         self.header_queue_size_label = self.right_header.queue_size_label
 
         # Create scrollable container for right content (file queue)
-        right_scroll = Gtk.ScrolledWindow()
-        right_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        right_scroll.set_vexpand(True)
+        right_scroll = Gtk.ScrolledWindow(
+            hscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vexpand=True,
+        )
 
         # Create right content container for file queue
-        right_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        right_content.set_margin_start(10)
-        right_content.set_margin_end(10)
-        right_content.set_margin_bottom(10)
+        right_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            margin_start=10,
+            margin_end=10,
+            margin_bottom=10,
+        )
 
         # Add the file queue directly to right content (removed queue_controls container)
         self.file_queue = FileQueue(self.converter)
@@ -629,8 +712,8 @@ class MainWindow(
         # Connect callback for when file row is activated (clicked)
         self.file_queue.on_activate_file = self.on_activate_file
 
-        # Initialize queue size label
-        self.update_queue_size_label(0, "0 files")
+        # Header, navigation and waveform widgets are all built in their
+        # empty-queue state, so update_queue_size_label only runs on changes
 
         # Add right content to scroll container
         right_scroll.set_child(right_content)
@@ -663,20 +746,22 @@ class MainWindow(
         self.visualizer.player = self.player
 
         # Create container for visualizer and zoom controls
-        visualizer_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        visualizer_container.add_css_class("dark-bottom-panel")
+        visualizer_container = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=0,
+            css_classes=["dark-bottom-panel"],
+        )
 
         # Create zoom control bar
-        zoom_control_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        zoom_control_box.set_margin_start(0)
-        zoom_control_box.set_margin_end(0)
-        zoom_control_box.add_css_class("dark-controls-bar")
+        zoom_control_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=12,
+            css_classes=["dark-controls-bar"],
+        )
 
         # Add "Only the Selected Area" toggle button — icon-only, like play controls
-        self.play_selection_switch = Gtk.ToggleButton()
+        self.play_selection_switch = Gtk.ToggleButton(css_classes=["flat", "circular"])
         self.play_selection_switch.set_icon_name("selection-mode-symbolic")
-        self.play_selection_switch.add_css_class("flat")
-        self.play_selection_switch.add_css_class("circular")
         self.play_selection_switch.set_active(False)
         self.play_selection_switch.connect(
             "toggled", self._on_play_selection_switch_toggled
@@ -692,11 +777,11 @@ class MainWindow(
         zoom_control_box.append(self.play_selection_switch)
 
         # Add "Auto-Advance" toggle button — icon-only
-        self.auto_advance_switch = Gtk.ToggleButton()
+        self.auto_advance_switch = Gtk.ToggleButton(css_classes=["flat", "circular"])
         self.auto_advance_switch.set_icon_name("media-playlist-consecutive-symbolic")
-        self.auto_advance_switch.add_css_class("flat")
-        self.auto_advance_switch.add_css_class("circular")
-        auto_advance_enabled = self.app.config.get("auto_advance_enabled", True)
+        auto_advance_enabled = self._config.get_bool(
+            config_keys.AUTO_ADVANCE_ENABLED, True
+        )
         self.auto_advance_switch.set_active(auto_advance_enabled)
         self.auto_advance_switch.connect(
             "toggled", self._on_auto_advance_switch_toggled
@@ -712,7 +797,9 @@ class MainWindow(
         zoom_control_box.append(self.auto_advance_switch)
 
         # Add Equalizer toggle button — icon-only
-        self.eq_toggle_btn = Gtk.ToggleButton()
+        self.eq_toggle_btn = Gtk.ToggleButton(
+            css_classes=["flat", "circular", "eq-icon-btn"]
+        )
         # Load custom equalizer SVG icon
         eq_icon_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
@@ -732,9 +819,6 @@ class MainWindow(
             self.eq_toggle_btn.set_child(eq_icon)
         else:
             self.eq_toggle_btn.set_icon_name("media-eq-symbolic")
-        self.eq_toggle_btn.add_css_class("flat")
-        self.eq_toggle_btn.add_css_class("circular")
-        self.eq_toggle_btn.add_css_class("eq-icon-btn")
         self.eq_toggle_btn.set_active(False)
         self.eq_toggle_btn.connect("toggled", self._on_eq_toggle_clicked)
         self.eq_toggle_btn.set_valign(Gtk.Align.CENTER)
@@ -752,24 +836,18 @@ class MainWindow(
         playback_controls_box.set_hexpand(True)
 
         # Previous audio button (left side)
-        self.prev_audio_btn = Gtk.Button()
+        self.prev_audio_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.prev_audio_btn.set_icon_name("media-skip-backward-symbolic")
-        self.prev_audio_btn.add_css_class("flat")
-        self.prev_audio_btn.add_css_class("circular")
         self.prev_audio_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Previous track")],
         )
-        self.prev_audio_btn.connect(
-            "clicked", lambda btn: self._on_previous_audio_clicked()
-        )
+        self.prev_audio_btn.connect("clicked", self._on_previous_audio_clicked)
         self.prev_audio_btn.set_visible(False)  # Initially hidden
         playback_controls_box.append(self.prev_audio_btn)
 
         # Pause/Play button (center)
-        self.pause_play_btn = Gtk.Button()
+        self.pause_play_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.pause_play_btn.set_icon_name("media-playback-start-symbolic")
-        self.pause_play_btn.add_css_class("flat")
-        self.pause_play_btn.add_css_class("circular")
         self.pause_play_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Play or pause")],
         )
@@ -777,16 +855,12 @@ class MainWindow(
         playback_controls_box.append(self.pause_play_btn)
 
         # Next audio button (right side)
-        self.next_audio_btn = Gtk.Button()
+        self.next_audio_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.next_audio_btn.set_icon_name("media-skip-forward-symbolic")
-        self.next_audio_btn.add_css_class("flat")
-        self.next_audio_btn.add_css_class("circular")
         self.next_audio_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Next track")],
         )
-        self.next_audio_btn.connect(
-            "clicked", lambda btn: self._on_next_audio_clicked()
-        )
+        self.next_audio_btn.connect("clicked", self._on_next_audio_clicked)
         self.next_audio_btn.set_visible(False)  # Initially hidden
         playback_controls_box.append(self.next_audio_btn)
 
@@ -802,10 +876,8 @@ class MainWindow(
         self.volume_value_label = Gtk.Label(label="100")
         self.volume_value_label.add_css_class("caption")
 
-        self.volume_btn = Gtk.Button()
+        self.volume_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.volume_btn.set_icon_name("audio-volume-high-symbolic")
-        self.volume_btn.add_css_class("flat")
-        self.volume_btn.add_css_class("circular")
         self.volume_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Volume")],
         )
@@ -865,10 +937,8 @@ class MainWindow(
         self.speed_value_label = Gtk.Label(label="1.00x")
         self.speed_value_label.add_css_class("caption")
 
-        self.speed_btn = Gtk.Button()
+        self.speed_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.speed_btn.set_icon_name("speedometer-symbolic")
-        self.speed_btn.add_css_class("flat")
-        self.speed_btn.add_css_class("circular")
         self.speed_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Playback speed")],
         )
@@ -931,10 +1001,8 @@ class MainWindow(
         self.zoom_value_label.add_css_class("caption")
 
         # Zoom button (opens popover with vertical slider)
-        self.zoom_btn = Gtk.Button()
+        self.zoom_btn = Gtk.Button(css_classes=["flat", "circular"])
         self.zoom_btn.set_icon_name("system-search-symbolic")
-        self.zoom_btn.add_css_class("flat")
-        self.zoom_btn.add_css_class("circular")
         self.zoom_btn.update_property(
             [Gtk.AccessibleProperty.LABEL], [_("Waveform zoom")],
         )
@@ -1005,14 +1073,14 @@ class MainWindow(
         self.visualizer_container = visualizer_container
 
         # Create a frame around the visualizer for better appearance
-        self.visualizer_frame = Gtk.Frame()
-        self.visualizer_frame.set_margin_start(10)
-        self.visualizer_frame.set_margin_end(10)
-        self.visualizer_frame.set_margin_top(4)
-        self.visualizer_frame.set_margin_bottom(0)
-
-        # Set minimum height instead of fixed size
-        self.visualizer_frame.set_size_request(-1, 100)  # Min height 100px
+        # (minimum height instead of fixed size)
+        self.visualizer_frame = Gtk.Frame(
+            margin_start=10,
+            margin_end=10,
+            margin_top=4,
+            margin_bottom=0,
+            height_request=100,
+        )
 
         # Connect seek handler before adding the visualizer to the frame
         self.visualizer.connect_seek_handler(self.on_visualizer_seek)
@@ -1080,74 +1148,51 @@ class MainWindow(
             "notify::position", self._on_visualizer_height_changed
         )
 
-        # Apply tooltips to all UI elements (must be after all widgets are created)
-        self._apply_tooltips()
+        # Apply tooltips once the first frame is out and the geometry restore
+        # idle has run; they only matter on hover
+        GLib.idle_add(self._apply_tooltips, priority=GLib.PRIORITY_LOW)
 
     def update_queue_size_label(self, count=None, text=None):
         """Update the queue size label in the header."""
         # Get count if not provided
-        if count is None and hasattr(self.file_queue, "get_queue_size"):
+        if count is None:
             count = self.file_queue.get_queue_size()
 
         # Get text if not provided
         if text is None:
             text = self.file_queue.get_queue_size_text()
 
-        # Update the label text
-        if hasattr(self, "right_header"):
-            try:
-                has_multiple_files = count > 1
-            except (ValueError, TypeError):
-                has_multiple_files = False
-
-            self.right_header.update_queue_label(text)
-            self.right_header.set_queue_info_visible(has_multiple_files)
-
-            # Update conversion button visibility
-            has_files = count > 0
-            self.right_header.set_convert_button_visible(has_files)
-
-        # Show/hide elements based on file count
         has_files = count > 0
         has_multiple_files = count >= 2
 
-        # Show/hide waveform based on file count (seekbar+controls always visible)
-        if hasattr(self, "visualizer_container"):
-            if (
-                has_files
-                and hasattr(self, "cut_row")
-                and self.cut_row.get_selected() > 0
-            ):
-                self.visualizer_frame.set_visible(True)
-            else:
-                self.visualizer_frame.set_visible(False)
-            # Collapse paned to show only seekbar+controls when no waveform
-            if not has_files or (
-                hasattr(self, "cut_row") and self.cut_row.get_selected() == 0
-            ):
-                GLib.idle_add(self._update_paned_for_cut_mode, False)
+        # Queue label and clear button only show with 2 or more files;
+        # the convert button shows when there's at least one file
+        self.right_header.update_queue_label(text)
 
-        # Queue size label only shows when there are 2 or more files (matching clear button)
-        self.header_queue_size_label.set_visible(has_multiple_files)
+        # Visibility only depends on this state; batch adds repeat it per file
+        cut_enabled = self.cut_row.get_selected() > 0
+        state = (has_files, has_multiple_files, cut_enabled)
+        if state == self._queue_visibility_state:
+            return
+        self._queue_visibility_state = state
 
-        # Show/hide navigation buttons - only visible with multiple files
-        if hasattr(self, "prev_audio_btn"):
-            self.prev_audio_btn.set_visible(has_multiple_files)
-        if hasattr(self, "next_audio_btn"):
-            self.next_audio_btn.set_visible(has_multiple_files)
+        self.right_header.set_queue_info_visible(has_multiple_files)
+        self.right_header.set_convert_button_visible(has_files)
 
-        # Clear queue button only shows when there are 2 or more files
-        if hasattr(self, "clear_queue_button"):
-            self.clear_queue_button.set_visible(has_multiple_files)
+        # Show/hide waveform based on file count (seekbar+controls always visible)
+        self.visualizer_frame.set_visible(has_files and cut_enabled)
+        # Collapse paned to show only seekbar+controls when no waveform
+        if not has_files or not cut_enabled:
+            GLib.idle_add(self._update_paned_for_cut_mode, False)
 
-        # Convert button shows when there's at least one file
-        if hasattr(self, "convert_button"):
-            self.convert_button.set_visible(has_files)
+        # Show/hide navigation buttons - only visible with multiple files
+        self.prev_audio_btn.set_visible(has_multiple_files)
+        self.next_audio_btn.set_visible(has_multiple_files)
 
     def _apply_tooltips(self):
         """Apply tooltips to UI elements."""
         if not self.tooltip_helper:
-            return
+            return False
 
         # Add tooltips to format combo parent row
         # Add tooltip to format row (Adw.ComboRow is the row itself)
@@ -1227,35 +1272,34 @@ class MainWindow(
         if hasattr(self, "eq_toggle_btn"):
             self.tooltip_helper.add_tooltip(self.eq_toggle_btn, "eq_toggle_btn")
 
+        # Waveform tooltip sits above the controls bar
+        self._setup_visualizer_tooltip()
+
+        return False  # Don't repeat idle_add
+
     def _on_tips_action_changed(self, action, value):
         """Handle mouseover tips toggle from hamburger menu."""
         state = value.get_boolean()
         action.set_state(value)
 
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("show_mouseover_tips", "true" if state else "false")
+        if self._config:
+            self._config.set("show_mouseover_tips", "true" if state else "false")
 
         if state:
-            # When enabling tooltips, re-apply all of them
+            # When enabling tooltips, re-apply all of them (visualizer included)
             self._apply_tooltips()
-            # Also setup visualizer tooltip
-            if hasattr(self, "visualizer"):
-                GLib.idle_add(self._setup_visualizer_tooltip)
         else:
             # When disabling tooltips, hide current
             if self.tooltip_helper:
                 self.tooltip_helper.hide(immediate=True)
             # Hide visualizer tooltip
-            if hasattr(self, "visualizer"):
+            if self.visualizer is not None:
                 self._hide_visualizer_tooltip()
 
     def _setup_visualizer_tooltip(self):
         """Setup tooltip for the waveform visualizer using the standard TooltipHelper."""
         if not self.tooltip_helper or not self.tooltip_helper.is_enabled():
-            return False
-
-        if not hasattr(self, "visualizer"):
-            return False
+            return
 
         # Use TooltipHelper with y_offset to position above the controls bar
         # Negative offset moves the tooltip up above the bar
@@ -1264,8 +1308,6 @@ class MainWindow(
             self.visualizer, "waveform_visualizer", y_offset=-bar_height
         )
 
-        return False  # Don't repeat idle_add
-
     def _hide_visualizer_tooltip(self):
         """Hide visualizer tooltip."""
         if self.tooltip_helper:
@@ -1342,25 +1384,26 @@ class MainWindow(
                     )
                     self.file_markers[self.active_audio_id] = current_markers
 
-            # Process each file's markers with the ordering preference
-            ordered_file_markers = {}
-            for file_path, markers in self.file_markers.items():
-                # Sort markers if needed (for files we didn't just process)
-                if file_path != self.active_audio_id:
-                    if order_by_number and markers:
-                        # Sort by segment number if that option is selected
-                        if "segment_index" in markers[0]:
-                            logger.debug(
-                                f"Reordering {len(markers)} segments for {os.path.basename(file_path)}"
-                            )
-                            ordered_markers = sorted(
-                                markers, key=lambda x: x.get("segment_index", 1)
-                            )
-                            ordered_file_markers[file_path] = ordered_markers
-                            continue
-
-                # Default: keep existing order (either original or already sorted)
-                ordered_file_markers[file_path] = markers
+            # Snapshot the markers so edits made during conversion don't leak
+            # into the running job. Timeline order needs no further work.
+            ordered_file_markers = dict(self.file_markers)
+
+            # Only files other than the active one can still need sorting
+            has_other_files = len(self.file_markers) > (
+                self.active_audio_id in self.file_markers
+            )
+            if order_by_number and has_other_files:
+                # segment_index values can have gaps (invalid pairs are
+                # skipped), so sort on the key instead of placing by position.
+                by_segment_index = operator.itemgetter("segment_index")
+                for file_path, markers in self.file_markers.items():
+                    # The active file was already ordered above
+                    if file_path == self.active_audio_id or not markers:
+                        continue
+                    if "segment_index" in markers[0]:
+                        ordered_file_markers[file_path] = sorted(
+                            markers, key=by_segment_index
+                        )
 
             # Store the ordered markers dictionary
             settings["file_markers"] = ordered_file_markers
@@ -1371,16 +1414,54 @@ class MainWindow(
                 and self.active_audio_id in settings["file_markers"]
             ):
                 current_file_segments = settings["file_markers"][self.active_audio_id]
-                if current_file_segments and len(current_file_segments) > 0:
+                if current_file_segments:
                     # Use segments from current file for backward compatibility
                     settings["cut_segments"] = current_file_segments
-                    logger.debug(
-                        f"Final segments order for conversion: {[(s.get('segment_index', '?'), s['start_str']) for s in current_file_segments]}"
-                    )
+                    # Only build the per-segment summary when it will be shown
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Final segments order for conversion: {[(s.get('segment_index', '?'), s['start_str']) for s in current_file_segments]}"
+                        )
 
         # Create a progress dialog
         files = self.file_queue.get_files()
         total_files = len(files)
+        # Progress ticks arrive many times per second; resolve names once
+        self._conversion_basenames = [os.path.basename(p) for p in files]
+        self._conversion_total = total_files
+        self._progress_template = _(
+            "Converting file {0} of {1} ({2}%)\nCurrent file: {3}"
+        )
+        # Latest (file_index, progress) and the scheduled UI refresh, if any
+        self._pending_progress = None
+        self._progress_timer_id = None
+
+        # Reuse the progress dialog across conversions
+        self._ensure_progress_dialog()
+        self.progress_bar.set_fraction(0.0)
+        self.progress_dialog.set_body(
+            _("Converting file 1 of {0}").format(total_files)
+        )
+
+        # Show the dialog
+        self.progress_dialog.present()
+
+        # Start conversion in a separate thread
+        threading.Thread(
+            target=self.converter.convert_all_files,
+            args=(
+                files,
+                settings,
+                self.on_conversion_progress,
+                self.on_conversion_finished,
+            ),
+            daemon=True,
+        ).start()
+
+    def _ensure_progress_dialog(self):
+        """Create the conversion progress dialog on first use."""
+        if self.progress_dialog is not None:
+            return
 
         # Create a box for the progress bar
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -1389,15 +1470,15 @@ class MainWindow(
 
         # Create progress bar
         self.progress_bar = Gtk.ProgressBar()
-        self.progress_bar.set_fraction(0.0)
         content_box.append(self.progress_bar)
 
         # Create the dialog with our custom content
         self.progress_dialog = Adw.MessageDialog(
             transient_for=self,
             title=_("Converting Files"),
-            body=_("Converting file 1 of {0}").format(total_files),
         )
+        # Hide instead of destroying so the next conversion can reuse it
+        self.progress_dialog.set_hide_on_close(True)
 
         # Set the extra child (content area)
         self.progress_dialog.set_extra_child(content_box)
@@ -1406,21 +1487,6 @@ class MainWindow(
         self.progress_dialog.add_response("cancel", _("Cancel"))
         self.progress_dialog.connect("response", self._on_conversion_cancel)
 
-        # Show the dialog
-        self.progress_dialog.present()
-
-        # Start conversion in a separate thread
-        threading.Thread(
-            target=self.converter.convert_all_files,
-            args=(
-                files,
-                settings,
-                self.on_conversion_progress,
-                self.on_conversion_finished,
-            ),
-            daemon=True,
-        ).start()
-
     def _on_conversion_cancel(self, dialog, response):
         """Handle cancel button in the conversion dialog."""
         if response == "cancel":
@@ -1430,13 +1496,33 @@ class MainWindow(
             self.progress_dialog.close()
 
     def on_conversion_progress(self, file_index, file_path, progress):
-        """Update conversion progress."""
+        """Record conversion progress; the UI picks up the latest value at 20 Hz."""
+        # Called from the conversion thread for every ffmpeg progress line.
+        # When a new file starts, push the finished file's last value so its
+        # row is not left short of its final state.
+        previous = self._pending_progress
+        if previous is not None and previous[0] != file_index:
+            GLib.idle_add(self.file_queue.update_progress, *previous)
+
+        self._pending_progress = (file_index, progress)
+        if self._progress_timer_id is None:
+            self._progress_timer_id = GLib.timeout_add(
+                50, self._apply_conversion_progress
+            )
+
+    def _apply_conversion_progress(self):
+        """Show the most recent conversion progress in the queue and dialog."""
+        self._progress_timer_id = None
+        if self._pending_progress is None:
+            return False
+        file_index, progress = self._pending_progress
+
         # Update queue item progress
-        GLib.idle_add(self.file_queue.update_progress, file_index, progress)
+        self.file_queue.update_progress(file_index, progress)
 
         # Update progress dialog
-        total_files = len(self.file_queue.get_files())
-        filename = os.path.basename(file_path)
+        total_files = self._conversion_total
+        filename = self._conversion_basenames[file_index]
 
         # Calculate overall progress (current file index + progress within current file)
         overall_progress = (file_index + progress) / total_files
@@ -1444,31 +1530,34 @@ class MainWindow(
         # Format percentage for display
         percent = int(overall_progress * 100)
 
-        def update_progress_ui():
-            try:
-                if hasattr(self, "progress_dialog") and self.progress_dialog:
-                    # Check if dialog still exists and is valid
-                    if hasattr(self.progress_bar, "set_fraction"):
-                        # Ensure progress is between 0 and 1
-                        safe_progress = max(0, min(1, overall_progress))
-                        self.progress_bar.set_fraction(safe_progress)
-
-                        # Update dialog message with percentage
-                        self.progress_dialog.set_body(
-                            _(
-                                "Converting file {0} of {1} ({2}%)\nCurrent file: {3}"
-                            ).format(file_index + 1, total_files, percent, filename)
-                        )
-            except Exception as e:
-                logger.error(f"Error updating progress UI: {e}")
-            return False  # Run once, don't repeat
-
-        GLib.idle_add(update_progress_ui)
+        try:
+            if self.progress_dialog is not None:
+                # Ensure progress is between 0 and 1
+                safe_progress = max(0, min(1, overall_progress))
+                self.progress_bar.set_fraction(safe_progress)
+
+                # Update dialog message with percentage
+                self.progress_dialog.set_body(
+                    self._progress_template.format(
+                        file_index + 1, total_files, percent, filename
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error updating progress UI: {e}")
+        return False  # Run once, don't repeat
 
     def on_conversion_finished(self, success, error_message=None, converted_files=None):
         """Handle conversion completion."""
+        # Settle the throttled progress now, while file indices still match
+        # the queue; a timer firing after the rows below are removed would
+        # paint a stale index onto another file
+        if self._progress_timer_id is not None:
+            GLib.source_remove(self._progress_timer_id)
+            self._apply_conversion_progress()
+        self._pending_progress = None
+
         # Close the progress dialog
-        if hasattr(self, "progress_dialog"):
+        if self.progress_dialog is not None:
             self.progress_dialog.close()
 
         if success:
@@ -1491,28 +1580,33 @@ class MainWindow(
 
     def _remove_converted_files(self, converted_files):
         """Remove successfully converted files from the queue."""
-        if not converted_files or not hasattr(self.file_queue, "get_files"):
+        if not converted_files:
             return
 
-        # Get all files in the queue
-        queue_files = self.file_queue.get_files()
+        # Map each queued path to its position once instead of searching the
+        # queue for every converted file
+        queue_positions = {
+            path: idx for idx, path in enumerate(self.file_queue.get_files_view())
+        }
 
         # Find file indexes to remove (in reverse order to avoid index shifting)
-        to_remove = []
-        for file_path in converted_files:
-            try:
-                idx = queue_files.index(file_path)
-                to_remove.append(idx)
-            except ValueError:
-                # File not in queue
-                pass
+        to_remove = [
+            queue_positions[file_path]
+            for file_path in converted_files
+            if file_path in queue_positions
+        ]
 
         # Sort in reverse order to remove from end first
         to_remove.sort(reverse=True)
 
-        # Remove each file
-        for idx in to_remove:
-            GLib.idle_add(self.file_queue.remove_file, idx)
+        # Remove them all from a single idle callback
+        def remove_all():
+            for idx in to_remove:
+                self.file_queue.remove_file(idx)
+            return False  # Run once, don't repeat
+
+        if to_remove:
+            GLib.idle_add(remove_all)
 
     def _show_conversion_success_dialog(self, file_count, converted_files=None):
         """Show an improved success dialog after conversion."""
@@ -1596,13 +1690,28 @@ class MainWindow(
     def on_close_request(self, window):
         """Handle window close event."""
         # Save current window state before closing
-        if not self.is_maximized() and hasattr(self.app, "config") and self.app.config:
+        if not self.is_maximized() and self._config:
             # Save the size if not maximized
             self._save_window_size()
 
+        # Write layout changes whose save timer has not fired yet
+        self._flush_geometry()
+
+        # Write any volume/speed change still waiting on its debounce
+        if self._volume_save_timer is not None:
+            GLib.source_remove(self._volume_save_timer)
+            self._flush_volume()
+        if self._speed_save_timer is not None:
+            GLib.source_remove(self._speed_save_timer)
+            self._flush_speed()
+
         # Flush pending config changes to disk
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.flush()
+        if self._config:
+            self._config.flush()
+
+        # Drop queued waveform jobs; the application's shutdown ends the
+        # running decode, which may be shared with another window
+        self.stop_background_work()
 
         # Stop any playing audio
         self.player.stop()
@@ -1610,8 +1719,17 @@ class MainWindow(
         self.converter.cleanup()
         return False
 
+    def stop_background_work(self):
+        """Cancel queued waveform jobs without waiting for the running one."""
+        if self._bg_pool is not None:
+            self._bg_pool.shutdown(wait=False, cancel_futures=True)
+            self._bg_pool = None
+
     def _on_sidebar_width_changed(self, paned, param):
         """Handle sidebar width changes and save to config."""
+        if not self._geometry_restored:
+            return
+
         width = paned.get_position()
 
         # Store this as a manually set width
@@ -1636,126 +1754,154 @@ class MainWindow(
             paned.set_position(350)
             width = 350
 
-        # Proceed with debouncing for saving settings
-        # Cancel any existing save timeout
-        if self._sidebar_save_timeout_id:
-            try:
-                GLib.source_remove(self._sidebar_save_timeout_id)
-            except Exception:
-                pass  # Source was already removed
-            self._sidebar_save_timeout_id = None
-
-        # Set new timeout to save after resize is completed (500ms of inactivity)
-        self._sidebar_save_timeout_id = GLib.timeout_add(
-            500, self._save_sidebar_width, width
-        )
-
-    def _save_sidebar_width(self, width):
-        """Save the sidebar width to config after resize is completed."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("sidebar_width", str(width))
-        self._sidebar_save_timeout_id = None
+        # Save once the drag settles
+        self._queue_geometry_save(config_keys.SIDEBAR_WIDTH, str(width))
+
+    def _queue_geometry_save(self, key, value):
+        """Remember a layout value and arm the shared geometry save timer."""
+        self._pending_geometry[key] = value
+        if not self._geometry_flush_armed:
+            self._geometry_flush_armed = True
+            GLib.timeout_add(500, self._flush_geometry)
+
+    def _flush_geometry(self):
+        """Write every pending layout value to config in one pass."""
+        self._geometry_flush_armed = False
+        pending, self._pending_geometry = self._pending_geometry, {}
+        for key, value in pending.items():
+            self._save_layout_value(key, value)
         return False  # Don't repeat the timeout
 
-    def _on_window_size_changed(self, window, param):
-        """Handle window size changes."""
-        # Only save size if the window is not maximized
-        if not self.is_maximized():
-            # Preserve the sidebar width by updating the split_view position
-            if hasattr(self, "split_view") and hasattr(self, "_manual_sidebar_width"):
-                # Set the position to maintain the sidebar width
-                self.split_view.set_position(self._manual_sidebar_width)
-
-            # Debounce to avoid saving while resizing
-            if hasattr(self, "_size_save_timeout_id") and self._size_save_timeout_id:
-                try:
-                    GLib.source_remove(self._size_save_timeout_id)
-                except Exception:
-                    pass  # Source was already removed
-
-            self._size_save_timeout_id = GLib.timeout_add(500, self._save_window_size)
-
     def _on_window_state_changed(self, window, param):
         """Handle window state changes (maximized)."""
         # Get current maximized state
         is_maximized = self.is_maximized()
 
         # Save maximized state to config
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("window_maximized", str(is_maximized).lower())
+        self._queue_geometry_save(
+            config_keys.WINDOW_MAXIMIZED, str(is_maximized).lower()
+        )
+
+        # When window is unmaximized, re-fit the panes once the surface has
+        # been laid out at its restored size (same path as the first map)
+        if (
+            not is_maximized
+            and self._geometry_restore_id is None
+            and self._surface_layout_id is None
+        ):
+            surface = self.get_surface()
+            if surface is not None:
+                self._surface_layout_id = surface.connect(
+                    "layout", self._on_surface_layout
+                )
 
-        # When window is unmaximized, make a single adjustment to fix the layout
-        if not is_maximized:
-            # Single adjustment with a small delay to allow window to settle
-            GLib.timeout_add(200, self._fix_layout_after_unmaximize)
+    def _save_layout_value(self, key, value):
+        """Store a window layout value (AppConfig ignores unchanged values)."""
+        if self._config:
+            self._config.set(key, value)
 
     def _save_window_size(self):
         """Save the current window size to config."""
-        if hasattr(self.app, "config") and self.app.config:
-            width = self.get_width()
-            height = self.get_height()
-
-            # Only save if the values are reasonable
-            if width > 200 and height > 200:
-                self.app.config.set("window_width", str(width))
-                self.app.config.set("window_height", str(height))
+        width = self.get_width()
+        height = self.get_height()
 
-        if hasattr(self, "_size_save_timeout_id"):
-            self._size_save_timeout_id = None
-
-        return False  # Don't repeat the timeout
-
-    def _fix_layout_after_unmaximize(self):
-        """Adjust visualizer height and position after unmaximizing."""
-        logger.debug("Fixing layout after unmaximize")
-        self._restore_geometry()
-        return False
+        # Only save if the values are reasonable
+        if width > 200 and height > 200:
+            self._save_layout_value(config_keys.WINDOW_WIDTH, str(width))
+            self._save_layout_value(config_keys.WINDOW_HEIGHT, str(height))
 
     def on_window_mapped(self, widget):
         """Called when the window is mapped. Restore geometry."""
-        # Use a short delay to ensure all allocations are done
-        GLib.idle_add(self._restore_geometry)
+        # A restore is already scheduled or waiting for the first layout
+        if self._geometry_restore_id is not None or self._surface_layout_id:
+            return False
+
+        if self.get_height() >= 100:
+            # Use a short delay to ensure all allocations are done
+            self._geometry_restore_id = GLib.idle_add(self._restore_geometry)
+        else:
+            # Not sized yet: wait for the surface layout instead of polling
+            surface = self.get_surface()
+            self._surface_layout_id = surface.connect(
+                "layout", self._on_surface_layout
+            )
         return False
 
+    def _on_surface_layout(self, surface, width, height):
+        """Schedule the geometry restore once the window has a usable size."""
+        if height < 100:
+            return
+        surface.disconnect(self._surface_layout_id)
+        self._surface_layout_id = None
+        if self._geometry_restore_id is None:
+            self._geometry_restore_id = GLib.idle_add(self._restore_geometry)
+
     def _restore_geometry(self):
         """Restore sidebar width and visualizer height after window is shown."""
         # Restore manual sidebar width
-        if hasattr(self, "_manual_sidebar_width") and hasattr(self, "split_view"):
-            self.split_view.set_position(self._manual_sidebar_width)
+        self._set_paned_position(self.split_view, self._manual_sidebar_width)
 
         # Apply saved cut audio state to visualizer now that it exists
-        if hasattr(self, "visualizer") and hasattr(self, "cut_row"):
+        if self.visualizer is not None:
             self.visualizer.set_markers_enabled(self.cut_row.get_selected() > 0)
 
         # Use the allocation-based height for accuracy
         window_height = self.get_height()
-        if window_height < 100:  # Window not properly sized yet
-            return True  # Try again
+        if window_height < 100:  # Allocation still lagging behind the surface
+            self._geometry_restore_attempts += 1
+            if self._geometry_restore_attempts > 20:
+                logger.warning(
+                    "Window height still %d px, waiting for a layout to restore",
+                    window_height,
+                )
+                self._geometry_restore_attempts = 0
+                self._geometry_restore_id = None
+                # Let user layout changes be saved meanwhile, and finish the
+                # restore once the surface reports a usable size
+                self._geometry_restored = True
+                surface = self.get_surface()
+                if surface is not None and self._surface_layout_id is None:
+                    self._surface_layout_id = surface.connect(
+                        "layout", self._on_surface_layout
+                    )
+                return False
+            # Poll on a timer so the retries don't monopolize the idle queue
+            self._geometry_restore_id = GLib.timeout_add(50, self._restore_geometry)
+            return False
+
+        self._geometry_restore_attempts = 0
 
         # Calculate proper position from saved visualizer height
         visualizer_position = max(200, window_height - self.visualizer_height - 50)
-        self.vertical_paned.set_position(visualizer_position)
+        self._set_paned_position(self.vertical_paned, visualizer_position)
 
         # If cut is off, collapse the waveform area
-        if hasattr(self, "cut_row") and self.cut_row.get_selected() == 0:
+        if self.cut_row.get_selected() == 0:
             GLib.idle_add(self._update_paned_for_cut_mode, False)
 
         # Visualizer height is managed by GTK Box layout, no need to set content_height here
 
+        self._geometry_restore_id = None
+        self._geometry_restored = True
         return False  # Don't repeat
 
     def on_clear_queue(self, button):
         """Show confirmation dialog before clearing the queue."""
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            title=_("Clear Queue"),
-            body=_("Are you sure you want to clear the queue?"),
-        )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("clear", _("Clear"))
-        dialog.set_response_appearance("clear", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.connect("response", self._on_clear_queue_response)
-        dialog.present()
+        # Build the dialog once and re-present it on later clicks
+        if self._clear_queue_dialog is None:
+            dialog = Adw.MessageDialog(
+                transient_for=self,
+                title=_("Clear Queue"),
+                body=_("Are you sure you want to clear the queue?"),
+            )
+            dialog.add_response("cancel", _("Cancel"))
+            dialog.add_response("clear", _("Clear"))
+            dialog.set_response_appearance("clear", Adw.ResponseAppearance.DESTRUCTIVE)
+            # Hide instead of destroying after a response so it can be reused
+            dialog.set_hide_on_close(True)
+            dialog.connect("response", self._on_clear_queue_response)
+            self._clear_queue_dialog = dialog
+        self._clear_queue_dialog.present()
 
     def _on_clear_queue_response(self, dialog, response):
         """Handle clear queue dialog response."""
@@ -1786,7 +1932,7 @@ class MainWindow(
         if isinstance(value, Gio.File):
             path = value.get_path()
             # Just add file without generating waveform
-            self.file_queue.add_file(path)
+            self._fq_add_file(path)
             return True
         return False
 
@@ -1796,72 +1942,36 @@ class MainWindow(
         dialog = Gtk.FileDialog()
         dialog.set_title(_("Select Audio or Video Files"))
 
-        # Create file filters
-        media_filter = Gtk.FileFilter()
-        media_filter.set_name(_("Audio and Video files"))
+        if self._file_filters is None:
+            self._build_file_filters()
+        dialog.set_filters(self._file_filters)
+        dialog.set_default_filter(self._media_filter)
 
-        # Add common audio file extensions - make them lowercase to ensure matching
-        audio_extensions = [
-            "mp3",
-            "wav",
-            "ogg",
-            "flac",
-            "m4a",
-            "aac",
-            "opus",
-            "wma",
-            "aiff",
-            "ape",
-            "alac",
-            "dsd",
-            "dsf",
-            "mka",
-            "oga",
-            "spx",
-            "tta",
-            "wv",
-        ]
+        # Open the dialog with multiple file selection
+        dialog.open_multiple(
+            parent=self, cancellable=None, callback=self._on_open_files_complete
+        )
 
-        # Add common video file extensions (can be converted to audio)
-        video_extensions = [
-            "mp4",
-            "mkv",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "webm",
-            "m4v",
-            "mpg",
-            "mpeg",
-            "3gp",
-            "ogv",
-            "ts",
-            "mts",
-            "m2ts",
-        ]
+    def _build_file_filters(self):
+        """Create the dialog filters once; they are reused on every open."""
+        media_filter = Gtk.FileFilter()
+        media_filter.set_name(_("Audio and Video files"))
 
-        # Add all extensions to the filter
-        for ext in audio_extensions + video_extensions:
-            media_filter.add_suffix(ext)
-            media_filter.add_suffix(ext.upper())  # Also add uppercase versions
+        # Add all extensions to the filter (patterns match any letter case)
+        for pattern in MEDIA_FILE_PATTERNS:
+            media_filter.add_pattern(pattern)
 
         # Add all files filter
         all_filter = Gtk.FileFilter()
         all_filter.set_name(_("All files"))
         all_filter.add_pattern("*")
 
-        # Add filters to the dialog
+        # One splice, one items-changed emission
         filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(media_filter)
-        filters.append(all_filter)
-        dialog.set_filters(filters)
-        dialog.set_default_filter(media_filter)
+        filters.splice(0, 0, [media_filter, all_filter])
 
-        # Open the dialog with multiple file selection
-        dialog.open_multiple(
-            parent=self, cancellable=None, callback=self._on_open_files_complete
-        )
+        self._media_filter = media_filter
+        self._file_filters = filters
 
     def _on_open_files_complete(self, dialog, result):
         """Handle completion of file open dialog."""
@@ -1882,49 +1992,16 @@ class MainWindow(
                 total_files = len(file_paths)
                 logger.info(f"Starting import of {total_files} files")
 
-                # First, try to suspend UI updates in file queue if possible
-                has_suspend_method = hasattr(self.file_queue, "suspend_updates")
-                has_resume_method = hasattr(self.file_queue, "resume_updates")
-
-                if has_suspend_method:
-                    self.file_queue.suspend_updates()
-
-                # Process files with timing
-                import time
-
+                # Add the batch in one call; the queue suspends its own UI
+                # updates and shares the duplicate check across the batch
                 start_time = time.time()
-
                 try:
-                    # Add files to queue
-                    for i, path in enumerate(file_paths):
-                        file_start = time.time()
-                        self.file_queue.add_file(path)
-                        file_time = time.time() - file_start
-
-                        # Log slow file additions (taking more than 100ms)
-                        if file_time > 0.1:
-                            logger.warning(
-                                f"Slow file addition: {path} took {file_time:.2f}s"
-                            )
-
-                        # Log progress periodically
-                        if i > 0 and (i % 10 == 0 or i == total_files - 1):
-                            elapsed = time.time() - start_time
-                            rate = (i + 1) / elapsed if elapsed > 0 else 0
-                            logger.info(
-                                f"Added {i + 1}/{total_files} files, {rate:.1f} files/sec"
-                            )
-                finally:
-                    # Resume UI updates
-                    if has_resume_method:
-                        self.file_queue.resume_updates()
-
-                    # Total time
+                    added = self.file_queue.add_files(file_paths)
                     total_time = time.time() - start_time
                     logger.info(
-                        f"Total import time: {total_time:.2f}s for {total_files} files ({total_files / total_time:.1f} files/sec)"
+                        f"Total import time: {total_time:.2f}s, added {added} of {total_files} files"
                     )
-
+                finally:
                     # Restore cursor
                     self._set_busy_cursor(False)
 
@@ -1934,8 +2011,7 @@ class MainWindow(
 
     def _set_busy_cursor(self, is_busy):
         """Set busy cursor while processing."""
-        cursor_name = "wait" if is_busy else "default"
-        cursor = Gdk.Cursor.new_from_name(cursor_name, None)
+        cursor = self._cursor_wait if is_busy else self._cursor_default
         self.get_surface().set_cursor(cursor)
 
     def on_file_added_to_empty_queue(self, file_path, index):
@@ -11,16 +11,24 @@ Usage:
         ...
 """
 
+import bisect
+import concurrent.futures
 import logging
-import threading
 
 from gi.repository import GLib
 
-from app.audio import waveform
-from app.utils.time_formatter import format_time_short
+from app.utils import config_keys
 
 logger = logging.getLogger(__name__)
 
+# Slack (seconds) when checking the playhead against a segment boundary
+SEGMENT_TOLERANCE = 0.02
+
+# Auto-advance waits for the current track to end, polling at most
+# NEXT_TRACK_WAIT_TICKS * NEXT_TRACK_POLL_MS (the old fixed 300 ms delay)
+NEXT_TRACK_POLL_MS = 50
+NEXT_TRACK_WAIT_TICKS = 6
+
 
 class PlaybackControllerMixin:
     """Mixin providing all playback control logic for MainWindow."""
@@ -28,17 +36,16 @@ class PlaybackControllerMixin:
     # --- Playback lifecycle ---
 
     def on_playback_finished(self, player):
-        """Handle playback completion and auto-play next file."""
+        """Handle playback completion and auto-play next file.
+
+        Always runs on the GTK main loop (eos and position updates are
+        dispatched there by the player), so queue state is updated directly.
+        """
         logger.info("Playback finished, checking for next track")
 
-        auto_advance_enabled = (
-            self.auto_advance_switch.get_active()
-            if hasattr(self, "auto_advance_switch")
-            else True
-        )
-        if not auto_advance_enabled:
+        if not self.auto_advance_switch.get_active():
             logger.info("Auto-advance disabled, stopping playback")
-            GLib.idle_add(self.file_queue.update_playing_state, False)
+            self.file_queue.update_playing_state(False)
             return
 
         current_index = self.file_queue.get_current_playing_index()
@@ -46,7 +53,7 @@ class PlaybackControllerMixin:
             logger.debug("No current track index found")
             return
 
-        files = self.file_queue.get_files()
+        files = self.file_queue.get_files_view()
         if not files:
             logger.debug("Queue is empty")
             return
@@ -55,16 +62,27 @@ class PlaybackControllerMixin:
         if next_index < len(files):
             logger.info(f"Auto-playing next file (index {next_index})")
             next_file = files[next_index]
-            GLib.timeout_add(300, self._play_next_file, next_file, next_index)
+            # Runs once the current track has actually ended (see
+            # _play_next_file), without a fixed delay after a real EOF
+            GLib.idle_add(self._play_next_file, next_file, next_index)
         else:
             logger.info("Reached end of queue, stopping playback")
-            GLib.idle_add(self.file_queue.update_playing_state, False)
+            self.file_queue.update_playing_state(False)
 
-    def _play_next_file(self, file_path, index):
+    def _play_next_file(self, file_path, index, wait_ticks=NEXT_TRACK_WAIT_TICKS):
         """Helper to play the next file with proper UI updates."""
         if self.player.current_file == file_path and self.player.is_playing():
             return False
 
+        # The position fallback fires up to 0.2 s before mpv reaches EOF;
+        # loading now would cut off the end of the track, so poll until the
+        # player stops (bounded by the delay this used to wait blindly)
+        if self.player.is_playing() and wait_ticks > 0:
+            GLib.timeout_add(
+                NEXT_TRACK_POLL_MS, self._play_next_file, file_path, index, wait_ticks - 1
+            )
+            return False
+
         same_file_as_active = file_path == self.active_audio_id
 
         # Reset visualizer/seekbar BEFORE load/play to avoid stale state
@@ -80,24 +98,13 @@ class PlaybackControllerMixin:
             self.player.play()
 
             # Sync button state immediately to avoid race with stop() idle callbacks
-            if hasattr(self, "pause_play_btn"):
-                self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
+            self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
 
             if not same_file_as_active:
-                threading.Thread(
-                    target=waveform.generate,
-                    args=(
-                        file_path,
-                        self.converter,
-                        self.visualizer,
-                        self.file_markers,
-                        self.zoom_control_box
-                        if hasattr(self, "zoom_control_box")
-                        else None,
-                        self.file_queue.track_metadata,
-                    ),
-                    daemon=True,
-                ).start()
+                # Imported on first use so numpy stays out of startup
+                from app.audio import waveform
+
+                self._submit_waveform_job(waveform.generate, file_path)
             else:
                 logger.debug(f"Same file, skipping waveform generation: {file_path}")
 
@@ -118,16 +125,34 @@ class PlaybackControllerMixin:
 
     def _save_current_file_state(self):
         """Save markers for the currently active file before switching."""
-        if self.active_audio_id and hasattr(self.visualizer, "get_marker_pairs"):
-            current_markers = self.visualizer.get_marker_pairs()
-            if current_markers:
-                logger.debug(
-                    f"Saving {len(current_markers)} markers for {self.active_audio_id}"
-                )
-                self.file_markers[self.active_audio_id] = current_markers
-            elif self.active_audio_id in self.file_markers:
-                logger.debug(f"Removing cached markers for {self.active_audio_id}")
-                del self.file_markers[self.active_audio_id]
+        file_id = self.active_audio_id
+        if not file_id:
+            return
+
+        # Skip rebuilding the marker dicts when the pairs are unchanged since
+        # the last save and the stored list is still the one saved here
+        signature = tuple(
+            (pair["start"], pair["stop"]) for pair in self.visualizer.marker_pairs
+        )
+        saved = self._saved_marker_state.get(file_id)
+        if (
+            saved is not None
+            and saved[0] == signature
+            and self.file_markers.get(file_id) is saved[1]
+        ):
+            return
+
+        current_markers = self.visualizer.get_marker_pairs()
+        if current_markers:
+            logger.debug(f"Saving {len(current_markers)} markers for {file_id}")
+            self.file_markers[file_id] = current_markers
+        elif file_id in self.file_markers:
+            logger.debug(f"Removing cached markers for {file_id}")
+            del self.file_markers[file_id]
+        self._saved_marker_state[file_id] = (
+            signature,
+            self.file_markers.get(file_id),
+        )
 
     def _prepare_visualizer_for_new_file(self, file_path, index):
         """Clears the old visualizer state and starts waveform generation for a new file."""
@@ -139,56 +164,60 @@ class PlaybackControllerMixin:
         self.active_audio_id = file_path
         logger.debug(f"Setting active_audio_id to: {file_path}")
 
-        if hasattr(self.file_queue, "set_active_file"):
-            self.file_queue.set_active_file(index)
+        self.file_queue.set_active_file(index)
 
         markers_enabled = self.visualizer.markers_enabled
         self.visualizer.clear_all_markers()
         self.visualizer.markers_enabled = markers_enabled
 
+        from app.audio import waveform
+
         if self.cut_row.get_selected() > 0:
-            threading.Thread(
-                target=waveform.generate,
-                args=(
-                    file_path,
-                    self.converter,
-                    self.visualizer,
-                    self.file_markers,
-                    self.zoom_control_box,
-                    self.file_queue.track_metadata,
-                ),
-                daemon=True,
-            ).start()
+            self._submit_waveform_job(waveform.generate, file_path)
         else:
-            threading.Thread(
-                target=waveform.activate_without_waveform,
-                args=(
-                    file_path,
-                    self.converter,
-                    self.visualizer,
-                    self.file_markers,
-                    self.zoom_control_box,
-                    self.file_queue.track_metadata,
-                ),
-                daemon=True,
-            ).start()
+            self._submit_waveform_job(waveform.activate_without_waveform, file_path)
+
+    def _submit_waveform_job(self, job, file_path):
+        """Run a waveform module job for file_path on the background pool."""
+        # Two workers so a new request can start, and cancel the previous
+        # decode, while that decode is still running
+        if self._bg_pool is None:
+            self._bg_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="waveform"
+            )
+        # A job still waiting in the queue is stale once a newer file is
+        # requested; drop it before it spawns ffmpeg
+        if self._waveform_future is not None:
+            self._waveform_future.cancel()
+        self._waveform_future = self._bg_pool.submit(
+            job,
+            file_path,
+            self.converter,
+            self.visualizer,
+            self.file_markers,
+            self.zoom_control_box,
+            self.file_queue.track_metadata,
+        )
 
     def _load_file_for_visualization(self, file_path, index, play_audio=True):
         """Load a file for visualization and optional playback."""
-        logger.info(f"_load_file_for_visualization: file={file_path}, play={play_audio}, current_playing={self.player.is_playing()}, current_file={self.player.current_file}")
+        # Player state read once; nothing below changes it before the checks
+        was_playing = self.player.is_playing()
+        loaded_file = self.player.current_file
+        logger.info(
+            "_load_file_for_visualization: file=%s, play=%s, current_playing=%s, current_file=%s",
+            file_path, play_audio, was_playing, loaded_file,
+        )
+        same_file = loaded_file == file_path
+
         # Toggling play/pause on the currently loaded file
-        if (
-            play_audio
-            and self.player.is_playing()
-            and self.player.current_file == file_path
-        ):
+        if play_audio and was_playing and same_file:
             self.player.pause()
-            if hasattr(self.file_queue, "update_playing_state"):
-                self.file_queue.update_playing_state(False)
+            self.file_queue.update_playing_state(False)
             return
 
         # Stop any different file that might be playing
-        if self.player.is_playing() and self.player.current_file != file_path:
+        if was_playing and not same_file:
             self.player.stop()
 
         # Save state of the previously active file
@@ -201,30 +230,20 @@ class PlaybackControllerMixin:
         # Load the file into the player
         if self.player.load(file_path, self.file_queue.track_metadata):
             if play_audio:
-                if hasattr(self.file_queue, "set_currently_playing"):
-                    self.file_queue.set_currently_playing(index)
+                self.file_queue.set_currently_playing(index)
                 self.player.play()
                 # Sync UI immediately — on_file_loaded will confirm later
-                if hasattr(self, "pause_play_btn"):
-                    self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
-                if hasattr(self.file_queue, "update_playing_state"):
-                    self.file_queue.update_playing_state(True)
-
-    # --- Time display ---
-
-    def _update_time_display(self, position, duration):
-        """Update the time display label (called via GLib.idle_add)."""
-        if hasattr(self, "time_display_label"):
-            duration_str = format_time_short(duration)
-            self.time_display_label.set_label(duration_str)
-        return False
+                self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
+                self.file_queue.update_playing_state(True)
 
     # --- Position tracking and segment transitions ---
 
     def on_player_position_updated(self, player, position, duration):
         """Handle position updates from player."""
         if duration > 0 and self.visualizer.duration != duration:
-            logger.debug(f"Updating visualizer.duration: {self.visualizer.duration} -> {duration}")
+            logger.debug(
+                "Updating visualizer.duration: %s -> %s", self.visualizer.duration, duration
+            )
             self.visualizer.duration = duration
         self.visualizer.set_position(position)
         self.seekbar.set_position(position)
@@ -235,8 +254,8 @@ class PlaybackControllerMixin:
             self.visualizer.zoom_level, self.visualizer.viewport_offset
         )
 
-        GLib.idle_add(self._update_time_display, position, duration)
-        GLib.idle_add(self._update_play_selection_button)
+        # Already on the main loop; no need for an extra idle source per tick
+        self._update_play_selection_button()
 
         # Handle segment transitions in Play Selection Only mode
         if self._playing_selection and self._selection_segments:
@@ -249,10 +268,11 @@ class PlaybackControllerMixin:
                 self._playing_selection = False
                 return
 
+            # Only the current segment is checked per tick: segments follow
+            # playback order (possibly marker-number order), not time order
             start, stop = self._selection_segments[self._current_segment_index]
-            TOLERANCE = 0.02  # 20ms
 
-            if position > stop - TOLERANCE:
+            if position > stop - SEGMENT_TOLERANCE:
                 logger.info(
                     f"Segment {self._current_segment_index + 1} end detected at {position:.3f}s (target: {stop:.3f}s). Transitioning."
                 )
@@ -261,23 +281,21 @@ class PlaybackControllerMixin:
                 GLib.idle_add(self._do_segment_transition_with_retry)
                 return
 
-            if position < start - TOLERANCE:
+            if position < start - SEGMENT_TOLERANCE:
                 logger.info(
                     f"Position {position:.3f}s is before segment start {start:.3f}s. Seeking to start."
                 )
                 self.player.seek(start)
                 return
 
-        # Auto-next detection fallback
-        if duration > 0 and position >= duration - 0.2:
-            if (
-                not hasattr(self, "_end_of_track_handled")
-                or not self._end_of_track_handled
-            ):
-                self._end_of_track_handled = True
-                GLib.idle_add(self.on_playback_finished, player)
-        elif hasattr(self, "_end_of_track_handled") and self._end_of_track_handled:
-            self._end_of_track_handled = False
+        # Auto-next detection fallback (threshold is kept by on_player_duration_changed)
+        if position < self._end_threshold:
+            if self._end_of_track_handled:
+                self._end_of_track_handled = False
+        elif not self._end_of_track_handled:
+            self._end_of_track_handled = True
+            # Position updates are already dispatched on the main loop
+            self.on_playback_finished(player)
 
     def _do_segment_transition_with_retry(self, retry_count=0):
         """Execute segment transition with error handling and retry capability."""
@@ -360,6 +378,10 @@ class PlaybackControllerMixin:
         if duration > 0:
             self.visualizer.duration = duration
             self.seekbar.set_duration(duration)
+            # Position at which the current track counts as finished
+            self._end_threshold = duration - 0.2
+        else:
+            self._end_threshold = float("inf")
 
     # --- Seek handling ---
 
@@ -368,9 +390,6 @@ class PlaybackControllerMixin:
         logger.info(
             f"MAIN_WINDOW: Received seek position={position:.6f}s, should_play={should_play}"
         )
-        if not hasattr(self.player, "seek"):
-            return
-
         # If marker is being dragged/resized, allow free seeking
         if self._marker_dragging:
             self.player.seek(position)
@@ -380,62 +399,26 @@ class PlaybackControllerMixin:
 
         # If in Play Selection Only mode, validate position is in a segment
         if self._play_selection_mode and self._selection_segments:
-            in_segment = False
-            for i, (start, stop) in enumerate(self._selection_segments):
-                if start <= position <= stop:
-                    in_segment = True
-                    self._current_segment_index = i
-                    logger.debug(f"Seek action sets current segment to index {i}")
-                    break
-
-            if not in_segment:
-                after_any_selection = False
-                for start, stop in self._selection_segments:
-                    if position > stop:
-                        after_any_selection = True
-                        break
-
-                if after_any_selection:
-                    next_segment = None
-                    for i, (start, stop) in enumerate(self._selection_segments):
-                        if start > position:
-                            next_segment = i
-                            break
-
-                    if next_segment is not None:
-                        position = self._selection_segments[next_segment][0]
-                        self._current_segment_index = next_segment
-                        logger.info(
-                            f"Seek after selection, jumping to next segment {next_segment} at {position:.3f}"
-                        )
-                    else:
-                        position = self._selection_segments[0][0]
-                        self._current_segment_index = 0
-                        logger.info(
-                            f"No segment after, jumping to first segment at {position:.3f}"
-                        )
+            segment = self._find_segment_at(position)
+            if segment is not None:
+                self._current_segment_index = segment
+                logger.debug("Seek action sets current segment to index %d", segment)
+            else:
+                # Outside every selection: go to the next one in time, which
+                # is also the nearest one when seeking before all of them
+                next_segment = self._find_next_segment(position)
+                if next_segment is not None:
+                    position = self._selection_segments[next_segment][0]
+                    self._current_segment_index = next_segment
+                    logger.info(
+                        f"Seek outside selections, jumping to next segment {next_segment} at {position:.3f}"
+                    )
                 else:
-                    nearest_segment = None
-                    min_distance = float("inf")
-
-                    for i, (start, stop) in enumerate(self._selection_segments):
-                        if position < start:
-                            distance = start - position
-                        elif position > stop:
-                            distance = position - stop
-                        else:
-                            distance = 0
-
-                        if distance < min_distance:
-                            min_distance = distance
-                            nearest_segment = i
-
-                    if nearest_segment is not None:
-                        position = self._selection_segments[nearest_segment][0]
-                        self._current_segment_index = nearest_segment
-                        logger.info(
-                            f"Seek before selections, jumping to nearest segment {nearest_segment} at {position:.3f}"
-                        )
+                    position = self._selection_segments[0][0]
+                    self._current_segment_index = 0
+                    logger.info(
+                        f"No segment after, jumping to first segment at {position:.3f}"
+                    )
 
             self._is_transitioning_segment = False
 
@@ -454,29 +437,21 @@ class PlaybackControllerMixin:
             self._load_selection_segments()
 
             if self._playing_selection and self._selection_segments:
-                current_position = (
-                    self.player._position if hasattr(self.player, "_position") else 0
-                )
-
-                found_index = -1
-                for i, (start, stop) in enumerate(self._selection_segments):
-                    if start <= current_position <= stop:
-                        found_index = i
-                        break
+                current_position = self.player._position
 
-                if found_index >= 0:
+                found_index = self._find_segment_at(current_position)
+                if found_index is not None:
                     self._current_segment_index = found_index
                     logger.debug(
-                        f"Updated current segment to {found_index} after marker change"
+                        "Updated current segment to %d after marker change", found_index
                     )
                 else:
-                    for i, (start, stop) in enumerate(self._selection_segments):
-                        if start > current_position:
-                            self._current_segment_index = i
-                            logger.debug(
-                                f"Jumped to next segment {i} after marker change"
-                            )
-                            break
+                    next_index = self._find_next_segment(current_position)
+                    if next_index is not None:
+                        self._current_segment_index = next_index
+                        logger.debug(
+                            "Jumped to next segment %d after marker change", next_index
+                        )
                     else:
                         logger.info("No valid segment after marker change, stopping")
                         self._playing_selection = False
@@ -495,24 +470,13 @@ class PlaybackControllerMixin:
             )
 
             if self._playing_selection and self._selection_segments:
-                current_position = (
-                    self.player._position if hasattr(self.player, "_position") else 0
-                )
+                current_position = self.player._position
 
-                if hasattr(self, "_last_transition_times"):
-                    self._last_transition_times.clear()
-                    logger.debug("Cleared transition tracking after drag end")
-
-                found_segment = -1
-                for i, (start, stop) in enumerate(self._selection_segments):
-                    if start <= current_position <= stop:
-                        found_segment = i
-                        break
-
-                if found_segment >= 0:
+                found_segment = self._find_segment_at(current_position)
+                if found_segment is not None:
                     self._current_segment_index = found_segment
                     logger.debug(
-                        f"Position {current_position:.3f}s is in segment {found_segment}"
+                        "Position %.3fs is in segment %d", current_position, found_segment
                     )
                 else:
                     if current_position < self._selection_segments[0][0]:
@@ -541,28 +505,28 @@ class PlaybackControllerMixin:
                             )
                         )
                     else:
-                        for i, (start, stop) in enumerate(self._selection_segments):
-                            if start > current_position:
-                                logger.info(
-                                    f"Position {current_position:.3f}s is in gap, seeking to next segment {i}"
+                        i = self._find_next_segment(current_position)
+                        if i is not None:
+                            logger.info(
+                                f"Position {current_position:.3f}s is in gap, seeking to next segment {i}"
+                            )
+                            self._current_segment_index = i
+                            self._marker_dragging = True
+                            start = self._selection_segments[i][0]
+
+                            def do_seek_and_reenable():
+                                if self.player.is_playing():
+                                    self.player.seek(start)
+                                GLib.timeout_add(
+                                    150,
+                                    lambda: (
+                                        setattr(self, "_marker_dragging", False),
+                                        False,
+                                    )[1],
                                 )
-                                self._current_segment_index = i
-                                self._marker_dragging = True
-
-                                def do_seek_and_reenable():
-                                    if self.player.is_playing():
-                                        self.player.seek(start)
-                                    GLib.timeout_add(
-                                        150,
-                                        lambda: (
-                                            setattr(self, "_marker_dragging", False),
-                                            False,
-                                        )[1],
-                                    )
-                                    return False
-
-                                GLib.idle_add(do_seek_and_reenable)
-                                break
+                                return False
+
+                            GLib.idle_add(do_seek_and_reenable)
 
     # --- Player state ---
 
@@ -573,14 +537,12 @@ class PlaybackControllerMixin:
         logger.info(f"State changed: reported={is_playing}, actual={actual_state}")
         is_playing = actual_state
 
-        if hasattr(self.file_queue, "update_playing_state"):
-            self.file_queue.update_playing_state(is_playing)
+        self.file_queue.update_playing_state(is_playing)
 
-        if hasattr(self, "pause_play_btn"):
-            if is_playing:
-                self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
-            else:
-                self.pause_play_btn.set_icon_name("media-playback-start-symbolic")
+        if is_playing:
+            self.pause_play_btn.set_icon_name("media-playback-pause-symbolic")
+        else:
+            self.pause_play_btn.set_icon_name("media-playback-start-symbolic")
 
     # --- Play/Pause/Next/Previous controls ---
 
@@ -605,13 +567,9 @@ class PlaybackControllerMixin:
                 logger.info(f"Loading active file for playback: {self.active_audio_id}")
                 self.player.load(self.active_audio_id, self.file_queue.track_metadata)
 
-                if active_index is not None and hasattr(
-                    self.file_queue, "set_currently_playing"
-                ):
+                if active_index is not None:
                     self.file_queue.set_currently_playing(active_index)
-            elif active_index is not None and hasattr(
-                self.file_queue, "set_currently_playing"
-            ):
+            elif active_index is not None:
                 self.file_queue.set_currently_playing(active_index)
 
             if self._play_selection_mode:
@@ -619,21 +577,15 @@ class PlaybackControllerMixin:
 
             self.player.play()
 
-    def _on_previous_audio_clicked(self):
+    def _on_previous_audio_clicked(self, button):
         """Handle previous audio button click - go to previous file in queue."""
         if not self.file_queue.files:
             return
 
         current_index = None
-        if (
-            hasattr(self.file_queue, "currently_playing_index")
-            and self.file_queue.currently_playing_index is not None
-        ):
+        if self.file_queue.currently_playing_index is not None:
             current_index = self.file_queue.currently_playing_index
-        elif (
-            hasattr(self.file_queue, "active_file_index")
-            and self.file_queue.active_file_index is not None
-        ):
+        elif self.file_queue.active_file_index is not None:
             current_index = self.file_queue.active_file_index
         else:
             current_index = len(self.file_queue.files)
@@ -644,21 +596,15 @@ class PlaybackControllerMixin:
         logger.info(f"Going to previous audio: {prev_file}")
         self._load_file_for_visualization(prev_file, prev_index, play_audio=True)
 
-    def _on_next_audio_clicked(self):
+    def _on_next_audio_clicked(self, button):
         """Handle next audio button click - go to next file in queue."""
         if not self.file_queue.files:
             return
 
         current_index = None
-        if (
-            hasattr(self.file_queue, "currently_playing_index")
-            and self.file_queue.currently_playing_index is not None
-        ):
+        if self.file_queue.currently_playing_index is not None:
             current_index = self.file_queue.currently_playing_index
-        elif (
-            hasattr(self.file_queue, "active_file_index")
-            and self.file_queue.active_file_index is not None
-        ):
+        elif self.file_queue.active_file_index is not None:
             current_index = self.file_queue.active_file_index
         else:
             current_index = -1
@@ -689,7 +635,7 @@ class PlaybackControllerMixin:
     def _on_auto_advance_switch_toggled(self, button):
         """Handle auto-advance toggle button state change."""
         is_active = button.get_active()
-        self.app.config.set("auto_advance_enabled", is_active)
+        self._config.set(config_keys.AUTO_ADVANCE_ENABLED, is_active)
         logger.info(f"Auto-advance mode: {'ENABLED' if is_active else 'DISABLED'}")
 
     def _load_selection_segments(self):
@@ -707,8 +653,42 @@ class PlaybackControllerMixin:
                 segments.append((start, stop))
 
         self._selection_segments = segments
+
+        # Time-sorted view for bisect lookups; segments themselves stay in
+        # playback order, which may be marker-number order
+        order = sorted(range(len(segments)), key=lambda i: segments[i][0])
+        self._segment_order = order
+        self._segment_starts = [segments[i][0] for i in order]
+        # Furthest stop among segments starting at or before each entry, so
+        # overlapping segments are still found by _find_segment_at
+        reach = []
+        furthest = float("-inf")
+        for i in order:
+            furthest = max(furthest, segments[i][1])
+            reach.append(furthest)
+        self._segment_reach = reach
         return segments
 
+    def _find_segment_at(self, position):
+        """Return the index of a selection segment containing position, or None."""
+        pos = bisect.bisect_right(self._segment_starts, position) - 1
+        if pos < 0 or position > self._segment_reach[pos]:
+            return None
+        # Usually the latest-starting candidate; walk back only on overlaps
+        segments = self._selection_segments
+        for k in range(pos, -1, -1):
+            index = self._segment_order[k]
+            if position <= segments[index][1]:
+                return index
+        return None
+
+    def _find_next_segment(self, position):
+        """Return the index of the first segment starting after position, or None."""
+        pos = bisect.bisect_right(self._segment_starts, position)
+        if pos < len(self._segment_order):
+            return self._segment_order[pos]
+        return None
+
     def _start_selection_playback(self):
         """Prepare for selection playback by setting state and seeking."""
         segments = self._load_selection_segments()
@@ -732,16 +712,16 @@ class PlaybackControllerMixin:
 
     def _update_play_selection_button(self):
         """Update Play Selection switch state based on markers."""
-        if not hasattr(self, "play_selection_switch"):
+        # Runs on every position tick; the marker scan only matters while the
+        # switch is on, since all it can do is turn the switch off
+        if not self.play_selection_switch.get_active():
             return False
 
-        has_complete_pair = False
-        for marker in self.visualizer.marker_pairs:
-            if marker.get("start") is not None and marker.get("stop") is not None:
-                has_complete_pair = True
-                break
-
-        if not has_complete_pair and self.play_selection_switch.get_active():
+        has_complete_pair = any(
+            marker.get("start") is not None and marker.get("stop") is not None
+            for marker in self.visualizer.marker_pairs
+        )
+        if not has_complete_pair:
             self.play_selection_switch.set_active(False)
 
         return False
@@ -757,16 +737,12 @@ class PlaybackControllerMixin:
             self.visualizer.clear_waveform()
             self.active_audio_id = None
 
-        if hasattr(self.player, "current_file"):
-            player_file = self.player.current_file
-            player_actual_file = getattr(self.player, "current_actual_file", None)
-
-            if player_file == file_id or (
-                player_actual_file and player_actual_file == file_id
-            ):
-                logger.info("Player had removed file loaded, stopping and clearing")
-                self.player.stop()
-                self.player.current_file = None
-                if hasattr(self.player, "current_actual_file"):
-                    self.player.current_actual_file = None
-                logger.debug("Stopped and unloaded player")
+        player_actual_file = self.player.current_actual_file
+        if self.player.current_file == file_id or (
+            player_actual_file and player_actual_file == file_id
+        ):
+            logger.info("Player had removed file loaded, stopping and clearing")
+            self.player.stop()
+            self.player.current_file = None
+            self.player.current_actual_file = None
+            logger.debug("Stopped and unloaded player")
@@ -15,7 +15,6 @@ Usage:
 import gettext
 import logging
 import math
-import threading
 
 import gi
 
@@ -23,13 +22,34 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, GLib, Gtk
 
-from app.audio import waveform
+from app.utils import config_keys
+from app.utils.config import is_true
 
 gettext.textdomain("big-audio-converter")
 _ = gettext.gettext
 
 logger = logging.getLogger(__name__)
 
+# Combo row choices and their positions, built once at import
+FORMATS = ("copy", "mp3", "ogg", "flac", "wav", "aac", "opus")
+BITRATES = ("32k", "64k", "128k", "192k", "256k", "320k")
+_FORMAT_INDEX = {fmt: idx for idx, fmt in enumerate(FORMATS)}
+_BITRATE_INDEX = {rate: idx for idx, rate in enumerate(BITRATES)}
+_DEFAULT_FORMAT_IDX = _FORMAT_INDEX["mp3"]
+_DEFAULT_BITRATE_IDX = _BITRATE_INDEX["192k"]
+
+# Saved cut_audio_mode values (0=off, 1=timeline order, 2=segment number order)
+_CUT_MODE_MAP = {"0": 0, "1": 1, "2": 2, 0: 0, 1: 1, 2: 2}
+
+
+def _resolve_cut_mode(settings):
+    """Return the cut mode from saved settings, falling back to the legacy on/off key."""
+    mode = _CUT_MODE_MAP.get(settings.get(config_keys.CUT_AUDIO_MODE))
+    if mode is not None:
+        return mode
+    # Legacy key: enabled meant timeline-ordered cutting
+    return 1 if is_true(settings.get(config_keys.CUT_AUDIO_ENABLED)) else 0
+
 
 class SettingsManagerMixin:
     """Mixin providing all conversion-settings logic for MainWindow."""
@@ -44,14 +64,14 @@ class SettingsManagerMixin:
         output_group.set_margin_end(12)
         output_group.set_margin_top(0)
 
-        self._format_list = ["copy", "mp3", "ogg", "flac", "wav", "aac", "opus"]
+        self._format_list = FORMATS
         format_model = Gtk.StringList.new(self._format_list)
         self.format_row = Adw.ComboRow(title=_("Output Format"), model=format_model)
-        self.format_row.set_selected(1)
+        self.format_row.set_selected(_DEFAULT_FORMAT_IDX)
         self.format_row.connect("notify::selected", self._on_format_changed)
         output_group.add(self.format_row)
 
-        self._bitrate_list = ["32k", "64k", "128k", "192k", "256k", "320k"]
+        self._bitrate_list = BITRATES
         bitrate_model = Gtk.StringList.new(self._bitrate_list)
         self.bitrate_row = Adw.ComboRow(title=_("Bitrate"), model=bitrate_model)
         self.bitrate_row.set_selected(2)
@@ -59,8 +79,7 @@ class SettingsManagerMixin:
         output_group.add(self.bitrate_row)
 
         # Audio channels
-        self._channels_list = [_("Original"), _("Mono"), _("Stereo")]
-        channels_model = Gtk.StringList.new(self._channels_list)
+        channels_model = Gtk.StringList.new([_("Original"), _("Mono"), _("Stereo")])
         self.channels_row = Adw.ComboRow(title=_("Channels"), model=channels_model)
         self.channels_row.set_selected(0)
         self.channels_row.connect("notify::selected", self._on_channels_changed)
@@ -92,16 +111,18 @@ class SettingsManagerMixin:
         cut_group.set_margin_end(12)
         cut_group.set_margin_top(6)
 
-        self._cut_list = [_("Off"), _("Chronological"), _("Segment Number")]
-        cut_model = Gtk.StringList.new(self._cut_list)
+        cut_model = Gtk.StringList.new(
+            [_("Off"), _("Chronological"), _("Segment Number")]
+        )
         self.cut_row = Adw.ComboRow(title=_("Mode"), model=cut_model)
         self.cut_row.set_selected(0)
         self.cut_row.connect("notify::selected", self._on_cut_combo_changed)
         cut_group.add(self.cut_row)
 
         # Segment output mode: separate files or merge into one
-        self._cut_output_list = [_("Separate Files"), _("Merge into One")]
-        cut_output_model = Gtk.StringList.new(self._cut_output_list)
+        cut_output_model = Gtk.StringList.new(
+            [_("Separate Files"), _("Merge into One")]
+        )
         self.cut_output_row = Adw.ComboRow(title=_("Output"), model=cut_output_model)
         self.cut_output_row.set_selected(0)
         self.cut_output_row.set_visible(False)
@@ -151,12 +172,13 @@ class SettingsManagerMixin:
         self.noise_expander.add_row(self.noise_strength_row)
 
         # GTCRN Advanced Controls
-        self._noise_model_list = [
-            _("Maximum Cleaning"),
-            _("Natural Voice"),
-            _("Smart (both combined)"),
-        ]
-        noise_model_model = Gtk.StringList.new(self._noise_model_list)
+        noise_model_model = Gtk.StringList.new(
+            [
+                _("Maximum Cleaning"),
+                _("Natural Voice"),
+                _("Smart (both combined)"),
+            ]
+        )
         self.noise_model_row = Adw.ComboRow(title=_("AI Model"), model=noise_model_model)
         self.noise_model_row.set_selected(0)
         self.noise_model_row.connect("notify::selected", self._on_noise_model_changed)
@@ -334,10 +356,10 @@ class SettingsManagerMixin:
 
     def _on_format_changed(self, row, pspec):
         """Handle format selection change and save setting."""
-        if hasattr(self.app, "config") and self.app.config:
+        if self._config:
             selected_format = self._format_list[row.get_selected()]
             if selected_format:
-                self.app.config.set("conversion_format", selected_format)
+                self._config.set(config_keys.CONVERSION_FORMAT, selected_format)
 
                 # Handle copy mode special case
                 if selected_format == "copy":
@@ -355,21 +377,20 @@ class SettingsManagerMixin:
 
     def _on_bitrate_changed(self, row, pspec):
         """Handle bitrate selection change and save setting."""
-        if hasattr(self.app, "config") and self.app.config:
+        if self._config:
             selected_bitrate = self._bitrate_list[row.get_selected()]
             if selected_bitrate:
-                self.app.config.set("conversion_bitrate", selected_bitrate)
+                self._config.set(config_keys.CONVERSION_BITRATE, selected_bitrate)
 
     def _on_channels_changed(self, row, pspec):
         """Handle channels selection change and save setting."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("audio_channels", str(row.get_selected()))
+        if self._config:
+            self._config.set(config_keys.AUDIO_CHANNELS, str(row.get_selected()))
 
     def _on_volume_spin_changed(self, spin):
         """Handle volume spin change and save setting."""
         volume = spin.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("conversion_volume", str(volume))
+        self._save_volume(volume)
 
         # Also update player volume (original functionality)
         player_volume = volume / 100.0
@@ -382,17 +403,47 @@ class SettingsManagerMixin:
     def _on_speed_spin_changed(self, spin):
         """Handle playback speed spin change and save setting."""
         speed = spin.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("conversion_speed", str(speed))
+        self._save_speed(speed)
 
         # Also update player speed (original functionality)
         self.player.set_playback_speed(speed)
-        self.player.set_pitch_correction(True)
+
+    def _save_volume(self, volume):
+        """Queue a save of the volume, coalescing rapid spin steps."""
+        self._pending_volume = volume
+        if self._volume_save_timer is None:
+            self._volume_save_timer = GLib.timeout_add(150, self._flush_volume)
+
+    def _flush_volume(self):
+        """Save the latest volume unless it matches the last value written."""
+        self._volume_save_timer = None
+        value = str(self._pending_volume)
+        if value != self._last_saved_volume_str:
+            self._last_saved_volume_str = value
+            if self._config:
+                self._config.set(config_keys.CONVERSION_VOLUME, value)
+        return False  # Don't repeat the timeout
+
+    def _save_speed(self, speed):
+        """Queue a save of the playback speed, coalescing rapid spin steps."""
+        self._pending_speed = speed
+        if self._speed_save_timer is None:
+            self._speed_save_timer = GLib.timeout_add(150, self._flush_speed)
+
+    def _flush_speed(self):
+        """Save the latest speed unless it matches the last value written."""
+        self._speed_save_timer = None
+        value = str(self._pending_speed)
+        if value != self._last_saved_speed_str:
+            self._last_saved_speed_str = value
+            if self._config:
+                self._config.set(config_keys.CONVERSION_SPEED, value)
+        return False  # Don't repeat the timeout
 
     def _on_noise_switch_changed(self, switch, state):
         """Handle noise reduction toggle and save setting."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("conversion_noise_reduction", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.CONVERSION_NOISE_REDUCTION, str(state).lower())
 
         self.noise_expander.set_enable_expansion(state)
         # Prevent auto-expansion from click propagation on the ExpanderRow
@@ -409,8 +460,8 @@ class SettingsManagerMixin:
     def _on_noise_strength_changed(self, scale):
         """Handle noise reduction strength change and save setting."""
         strength = scale.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("noise_reduction_strength", str(strength))
+        if self._config:
+            self._config.set(config_keys.NOISE_REDUCTION_STRENGTH, str(strength))
 
         if hasattr(self.player, "set_noise_strength"):
             self.player.set_noise_strength(strength)
@@ -431,9 +482,9 @@ class SettingsManagerMixin:
             model = 0
             blending = True
 
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("noise_model", str(model))
-            self.app.config.set("noise_model_blend", str(blending).lower())
+        if self._config:
+            self._config.set(config_keys.NOISE_MODEL, str(model))
+            self._config.set(config_keys.NOISE_MODEL_BLEND, str(blending).lower())
         if hasattr(self.player, "set_noise_model"):
             self.player.set_noise_model(model)
         if hasattr(self.player, "set_noise_advanced"):
@@ -446,10 +497,10 @@ class SettingsManagerMixin:
 
     def _on_noise_advanced_changed(self, *args):
         """Handle any GTCRN advanced control change."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("noise_speech_strength", str(self.noise_speech_strength_scale.get_value()))
-            self.app.config.set("noise_lookahead", str(int(self.noise_lookahead_scale.get_value())))
-            self.app.config.set("noise_voice_enhance", str(self.noise_voice_enhance_scale.get_value()))
+        if self._config:
+            self._config.set(config_keys.NOISE_SPEECH_STRENGTH, str(self.noise_speech_strength_scale.get_value()))
+            self._config.set(config_keys.NOISE_LOOKAHEAD, str(int(self.noise_lookahead_scale.get_value())))
+            self._config.set(config_keys.NOISE_VOICE_ENHANCE, str(self.noise_voice_enhance_scale.get_value()))
         # Derive blending from model combo index
         model_index = self.noise_model_row.get_selected()
         blending = model_index == 2
@@ -463,8 +514,8 @@ class SettingsManagerMixin:
 
     def _on_gate_switch_changed(self, switch, state):
         """Handle noise gate toggle."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("gate_enabled", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.GATE_ENABLED, str(state).lower())
 
         self.gate_expander.set_enable_expansion(state)
         self.gate_intensity_scale.set_sensitive(state)
@@ -480,16 +531,16 @@ class SettingsManagerMixin:
     def _on_gate_intensity_changed(self, scale):
         """Handle gate intensity slider change."""
         intensity = scale.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("gate_intensity", str(intensity))
+        if self._config:
+            self._config.set(config_keys.GATE_INTENSITY, str(intensity))
 
         if hasattr(self.player, "set_gate_intensity"):
             self.player.set_gate_intensity(intensity)
 
     def _on_compressor_switch_changed(self, switch, state):
         """Handle compressor toggle."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("compressor_enabled", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.COMPRESSOR_ENABLED, str(state).lower())
 
         self.compressor_expander.set_enable_expansion(state)
         self.compressor_intensity_scale.set_sensitive(state)
@@ -505,8 +556,8 @@ class SettingsManagerMixin:
     def _on_compressor_intensity_changed(self, scale):
         """Handle compressor intensity change."""
         intensity = scale.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("compressor_intensity", str(intensity))
+        if self._config:
+            self._config.set(config_keys.COMPRESSOR_INTENSITY, str(intensity))
 
         if hasattr(self.player, "set_compressor_intensity"):
             self.player.set_compressor_intensity(intensity)
@@ -514,8 +565,8 @@ class SettingsManagerMixin:
     def _on_hpf_switch_changed(self, row, pspec):
         """Handle high-pass filter toggle."""
         state = row.get_active()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("hpf_enabled", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.HPF_ENABLED, str(state).lower())
 
         self.hpf_freq_row.set_visible(state)
 
@@ -525,8 +576,8 @@ class SettingsManagerMixin:
     def _on_hpf_freq_changed(self, scale):
         """Handle HPF frequency change."""
         freq = int(scale.get_value())
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("hpf_frequency", str(freq))
+        if self._config:
+            self._config.set(config_keys.HPF_FREQUENCY, str(freq))
 
         if hasattr(self.player, "set_hpf_frequency"):
             self.player.set_hpf_frequency(freq)
@@ -534,8 +585,8 @@ class SettingsManagerMixin:
     def _on_transient_switch_changed(self, row, pspec):
         """Handle transient suppressor toggle."""
         state = row.get_active()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("transient_enabled", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.TRANSIENT_ENABLED, str(state).lower())
 
         self.transient_attack_row.set_visible(state)
 
@@ -545,8 +596,8 @@ class SettingsManagerMixin:
     def _on_transient_attack_changed(self, scale):
         """Handle transient attack change."""
         attack = scale.get_value()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("transient_attack", str(attack))
+        if self._config:
+            self._config.set(config_keys.TRANSIENT_ATTACK, str(attack))
 
         if hasattr(self.player, "set_transient_attack"):
             self.player.set_transient_attack(attack)
@@ -554,14 +605,14 @@ class SettingsManagerMixin:
     def _on_normalize_switch_changed(self, row, pspec):
         """Handle loudness normalization toggle."""
         state = row.get_active()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("normalize_enabled", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.NORMALIZE_ENABLED, str(state).lower())
 
     def _on_waveform_switch_changed(self, row, pspec):
         """Handle waveform generation toggle and save setting."""
         state = row.get_active()
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("generate_waveforms", str(state).lower())
+        if self._config:
+            self._config.set(config_keys.GENERATE_WAVEFORMS, str(state).lower())
 
         # If enabling waveforms and there's an active file without waveform data, generate it
         if state and self.active_audio_id:
@@ -571,20 +622,10 @@ class SettingsManagerMixin:
                     f"Waveforms enabled, generating for active file: {self.active_audio_id}"
                 )
 
-                threading.Thread(
-                    target=waveform.generate,
-                    args=(
-                        self.active_audio_id,
-                        self.converter,
-                        self.visualizer,
-                        self.file_markers,
-                        self.zoom_control_box
-                        if hasattr(self, "zoom_control_box")
-                        else None,
-                        self.file_queue.track_metadata,
-                    ),
-                    daemon=True,
-                ).start()
+                # Imported on first use so numpy stays out of startup
+                from app.audio import waveform
+
+                self._submit_waveform_job(waveform.generate, self.active_audio_id)
 
     def _on_cut_combo_changed(self, row, pspec):
         """Handle cut audio combo box changes."""
@@ -600,7 +641,7 @@ class SettingsManagerMixin:
             self.cut_output_row.set_visible(enabled)
 
         # Enable/disable waveform markers
-        if hasattr(self, "visualizer"):
+        if self.visualizer is not None:
             self.visualizer.set_markers_enabled(enabled)
 
         # Show/hide waveform-related UI elements based on cut mode
@@ -617,34 +658,21 @@ class SettingsManagerMixin:
         self._update_paned_for_cut_mode(enabled)
 
         # Generate waveform if enabling cut and active file has no waveform data
-        if enabled and hasattr(self, "active_audio_id") and self.active_audio_id:
-            if hasattr(self, "visualizer") and self.visualizer.waveform_data is None:
-                threading.Thread(
-                    target=waveform.generate,
-                    args=(
-                        self.active_audio_id,
-                        self.converter,
-                        self.visualizer,
-                        self.file_markers,
-                        self.zoom_control_box
-                        if hasattr(self, "zoom_control_box")
-                        else None,
-                        self.file_queue.track_metadata
-                        if hasattr(self, "file_queue")
-                        else None,
-                    ),
-                    daemon=True,
-                ).start()
+        if enabled and self.active_audio_id:
+            if self.visualizer is not None and self.visualizer.waveform_data is None:
+                from app.audio import waveform
+
+                self._submit_waveform_job(waveform.generate, self.active_audio_id)
 
         # Save setting
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("cut_audio_enabled", str(enabled).lower())
-            self.app.config.set("cut_audio_mode", str(active))
+        if self._config:
+            self._config.set(config_keys.CUT_AUDIO_ENABLED, str(enabled).lower())
+            self._config.set(config_keys.CUT_AUDIO_MODE, str(active))
 
     def _on_cut_output_changed(self, row, pspec):
         """Handle cut output mode change (separate files vs merge)."""
-        if hasattr(self.app, "config") and self.app.config:
-            self.app.config.set("cut_output_mode", str(row.get_selected()))
+        if self._config:
+            self._config.set(config_keys.CUT_OUTPUT_MODE, str(row.get_selected()))
 
     def _update_paned_for_cut_mode(self, cut_enabled):
         """Collapse or restore the paned position based on cut mode."""
@@ -666,15 +694,17 @@ class SettingsManagerMixin:
             # Only save if not already collapsed
             if current_pos < collapse_pos - 10:
                 self._saved_paned_position = current_pos
-            self.vertical_paned.set_position(collapse_pos)
+            self._set_paned_position(self.vertical_paned, collapse_pos)
         else:
             # Restore saved paned position
             if hasattr(self, "_saved_paned_position") and self._saved_paned_position:
-                self.vertical_paned.set_position(self._saved_paned_position)
+                self._set_paned_position(
+                    self.vertical_paned, self._saved_paned_position
+                )
             else:
                 # Fallback: use saved visualizer height
                 visualizer_position = max(200, total_height - self.visualizer_height - 50)
-                self.vertical_paned.set_position(visualizer_position)
+                self._set_paned_position(self.vertical_paned, visualizer_position)
 
     # --- Equalizer toggle ---
 
@@ -752,7 +782,7 @@ class SettingsManagerMixin:
 
     def _config_float(self, key, default):
         """Get a float config value, returning default on missing/invalid."""
-        saved = self.app.config.get(key)
+        saved = self._saved_settings.get(key)
         if saved is not None:
             try:
                 return float(saved)
@@ -762,7 +792,7 @@ class SettingsManagerMixin:
 
     def _config_int(self, key, default, lo=None, hi=None):
         """Get an int config value, clamped to [lo, hi] if given."""
-        saved = self.app.config.get(key)
+        saved = self._saved_settings.get(key)
         if saved is not None:
             try:
                 val = int(saved)
@@ -777,26 +807,34 @@ class SettingsManagerMixin:
 
     def _config_bool(self, key, default=False):
         """Get a boolean config value."""
-        saved = self.app.config.get(key)
+        saved = self._saved_settings.get(key)
         if saved is not None:
-            return str(saved).lower() == "true"
+            return is_true(saved)
         return default
 
-    def _config_list_index(self, key, valid_list, default_idx):
-        """Get a config value's index in valid_list, or default_idx."""
-        saved = self.app.config.get(key)
-        if saved and saved in valid_list:
-            return valid_list.index(saved)
-        return default_idx
+    def _config_list_index(self, key, index_map, default_idx):
+        """Get a config value's position from index_map, or default_idx."""
+        return index_map.get(self._saved_settings.get(key), default_idx)
 
     def _restore_conversion_settings(self):
         """Restore saved conversion settings from config."""
-        if not hasattr(self.app, "config") or not self.app.config:
+        if not self._config:
             return
 
+        # Read the settings once; the _config_* helpers look values up here
+        self._saved_settings = self._config.snapshot()
+        try:
+            self._apply_saved_settings()
+        finally:
+            self._saved_settings = {}
+
+    def _apply_saved_settings(self):
+        """Apply the settings snapshot taken by _restore_conversion_settings."""
         # Restore format selection
         self.format_row.set_selected(
-            self._config_list_index("conversion_format", self._format_list, 1)
+            self._config_list_index(
+                config_keys.CONVERSION_FORMAT, _FORMAT_INDEX, _DEFAULT_FORMAT_IDX
+            )
         )
 
         # Don't show copy mode dialog or apply UI on startup
@@ -807,7 +845,9 @@ class SettingsManagerMixin:
 
         # Restore bitrate selection
         self.bitrate_row.set_selected(
-            self._config_list_index("conversion_bitrate", self._bitrate_list, 3)
+            self._config_list_index(
+                config_keys.CONVERSION_BITRATE, _BITRATE_INDEX, _DEFAULT_BITRATE_IDX
+            )
         )
 
         # Set bitrate visibility based on format (only lossy formats use bitrate)
@@ -816,38 +856,40 @@ class SettingsManagerMixin:
         self.bitrate_row.set_visible(current_format in lossy_formats)
 
         # Restore channels
-        if hasattr(self, "channels_row"):
-            self.channels_row.set_selected(
-                self._config_int("audio_channels", 0, lo=0, hi=2)
-            )
-            # Hide channels in copy mode
-            self.channels_row.set_visible(current_format != "copy")
+        self.channels_row.set_selected(
+            self._config_int(config_keys.AUDIO_CHANNELS, 0, lo=0, hi=2)
+        )
+        # Hide channels in copy mode
+        self.channels_row.set_visible(current_format != "copy")
 
         # Restore volume
-        vol_val = self._config_float("conversion_volume", 100)
+        vol_val = self._config_float(config_keys.CONVERSION_VOLUME, 100)
+        # Seed the last-saved value so echoing it back to the spin is free
+        self._last_saved_volume_str = str(float(vol_val))
         self.volume_spin.set_value(vol_val)
         if hasattr(self, "volume_scale"):
             self.volume_scale.set_value(self._volume_to_slider(vol_val))
             self.volume_value_label.set_text(f"{int(vol_val)}")
 
         # Restore speed
-        spd_val = self._config_float("conversion_speed", 1.0)
+        spd_val = self._config_float(config_keys.CONVERSION_SPEED, 1.0)
+        self._last_saved_speed_str = str(float(spd_val))
         self.speed_spin.set_value(spd_val)
         if hasattr(self, "speed_scale"):
             self.speed_scale.set_value(self._speed_to_slider(spd_val))
             self.speed_value_label.set_text(f"{spd_val:.2f}x")
 
         # Restore noise reduction
-        self.noise_switch.set_active(self._config_bool("conversion_noise_reduction"))
+        self.noise_switch.set_active(self._config_bool(config_keys.CONVERSION_NOISE_REDUCTION))
 
         # Restore noise reduction strength
         self.noise_strength_scale.set_value(
-            self._config_float("noise_reduction_strength", 1.0)
+            self._config_float(config_keys.NOISE_REDUCTION_STRENGTH, 1.0)
         )
 
         # Restore GTCRN advanced controls — derive combo index from model + blending
-        saved_model = self._config_int("noise_model", 0, lo=0, hi=1)
-        saved_blending = self._config_bool("noise_model_blend")
+        saved_model = self._config_int(config_keys.NOISE_MODEL, 0, lo=0, hi=1)
+        saved_blending = self._config_bool(config_keys.NOISE_MODEL_BLEND)
         if saved_blending:
             model_combo_index = 2  # Smart (both combined)
         elif saved_model == 1:
@@ -857,72 +899,54 @@ class SettingsManagerMixin:
         self.noise_model_row.set_selected(model_combo_index)
 
         self.noise_speech_strength_scale.set_value(
-            self._config_float("noise_speech_strength", 1.0)
+            self._config_float(config_keys.NOISE_SPEECH_STRENGTH, 1.0)
         )
         self.noise_lookahead_scale.set_value(
-            self._config_float("noise_lookahead", 0)
+            self._config_float(config_keys.NOISE_LOOKAHEAD, 0)
         )
         self.noise_voice_enhance_scale.set_value(
-            self._config_float("noise_voice_enhance", 0.0)
+            self._config_float(config_keys.NOISE_VOICE_ENHANCE, 0.0)
         )
 
         # Restore noise gate settings (intensity slider)
-        self.gate_switch.set_active(self._config_bool("gate_enabled"))
+        self.gate_switch.set_active(self._config_bool(config_keys.GATE_ENABLED))
         self.gate_expander.set_expanded(False)
         self.gate_intensity_scale.set_value(
-            self._config_float("gate_intensity", 0.5)
+            self._config_float(config_keys.GATE_INTENSITY, 0.5)
         )
 
         # Restore compressor
-        self.compressor_switch.set_active(self._config_bool("compressor_enabled"))
+        self.compressor_switch.set_active(self._config_bool(config_keys.COMPRESSOR_ENABLED))
         self.compressor_expander.set_expanded(False)
         self.compressor_intensity_scale.set_value(
-            self._config_float("compressor_intensity", 1.0)
+            self._config_float(config_keys.COMPRESSOR_INTENSITY, 1.0)
         )
 
         # Restore HPF
-        self.hpf_row.set_active(self._config_bool("hpf_enabled"))
-        self.hpf_freq_scale.set_value(self._config_float("hpf_frequency", 80))
+        self.hpf_row.set_active(self._config_bool(config_keys.HPF_ENABLED))
+        self.hpf_freq_scale.set_value(self._config_float(config_keys.HPF_FREQUENCY, 80))
 
         # Restore transient
-        self.transient_row.set_active(self._config_bool("transient_enabled"))
+        self.transient_row.set_active(self._config_bool(config_keys.TRANSIENT_ENABLED))
         self.transient_attack_scale.set_value(
-            self._config_float("transient_attack", -0.5)
+            self._config_float(config_keys.TRANSIENT_ATTACK, -0.5)
         )
 
         # Restore normalization
-        self.normalize_row.set_active(self._config_bool("normalize_enabled"))
-
-        # Restore cut audio mode if present
-        if hasattr(self, "cut_row"):
-            mode = self._config_int("cut_audio_mode", -1, lo=0, hi=2)
-            if mode < 0:
-                # Legacy key fallback
-                mode = 1 if self._config_bool("cut_audio_enabled") else 0
-            self.cut_row.set_selected(mode)
-
-            # Set visibility based on combo selection
-            active = self.cut_row.get_selected()
-            if hasattr(self, "cut_options_box"):
-                self.cut_options_box.set_visible(active > 0)
-
-            # Restore cut output mode (separate files vs merge)
-            if hasattr(self, "cut_output_row"):
-                self.cut_output_row.set_visible(active > 0)
-                self.cut_output_row.set_selected(
-                    self._config_int("cut_output_mode", 0, lo=0, hi=1)
-                )
+        self.normalize_row.set_active(self._config_bool(config_keys.NORMALIZE_ENABLED))
 
-            # The markers will be enabled in the window realize callback
-            # after the visualizer is fully created
+        # Restore cut audio mode
+        self.cut_row.set_selected(_resolve_cut_mode(self._saved_settings))
 
-            # Restore cut times if those UI elements exist
-            if hasattr(self, "start_time_entry"):
-                saved_start_time = self.app.config.get("cut_start_time")
-                if saved_start_time:
-                    self.start_time_entry.set_text(saved_start_time)
+        # Set visibility based on combo selection
+        active = self.cut_row.get_selected()
+        self.cut_options_box.set_visible(active > 0)
+
+        # Restore cut output mode (separate files vs merge)
+        self.cut_output_row.set_visible(active > 0)
+        self.cut_output_row.set_selected(
+            self._config_int(config_keys.CUT_OUTPUT_MODE, 0, lo=0, hi=1)
+        )
 
-            if hasattr(self, "end_time_entry"):
-                saved_end_time = self.app.config.get("cut_end_time")
-                if saved_end_time:
-                    self.end_time_entry.set_text(saved_end_time)
+        # The markers will be enabled in the window realize callback
+        # after the visualizer is fully created
@@ -12,7 +12,6 @@ from threading import Lock
 
 import cairo
 import gi
-import numpy as np
 
 from app.ui.marker_manager import MarkerManagerMixin, MarkerMode
 from app.utils.time_formatter import format_time_ruler, format_time_short
@@ -25,6 +24,17 @@ _ = gettext.gettext
 
 logger = logging.getLogger(__name__)
 
+# Named cursors are display-independent, so one instance per name is shared
+_CURSORS = {}
+
+
+def _named_cursor(name):
+    """Return the cached Gdk.Cursor for a CSS cursor name."""
+    cursor = _CURSORS.get(name)
+    if cursor is None:
+        cursor = _CURSORS[name] = Gdk.Cursor.new_from_name(name)
+    return cursor
+
 
 class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
     """Widget that displays audio waveform visualization."""
@@ -117,6 +127,7 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
         # Loading state for waveform generation
         self.is_loading = False
         self.loading_message = _("Generating waveform...")
+        self._loading_anim_id = 0
 
         # Add scroll controller for zoom and horizontal panning with Shift
         scroll_controller = Gtk.EventControllerScroll()
@@ -141,7 +152,18 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
         self.loading_message = (
             message if message is not None else _("Generating waveform...")
         )
+        # One repeating timer drives the spinner for as long as loading lasts
+        if is_loading and not self._loading_anim_id:
+            self._loading_anim_id = GLib.timeout_add(50, self._on_loading_anim_tick)
+        self.queue_draw()
+
+    def _on_loading_anim_tick(self):
+        """Redraw the loading spinner at ~20 FPS until loading ends."""
+        if not self.is_loading:
+            self._loading_anim_id = 0
+            return False
         self.queue_draw()
+        return True
 
     def set_waveform(self, data, duration):
         """Set the waveform data to visualize."""
@@ -159,16 +181,9 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
             # Important: Do NOT clear markers here, as it interferes with the
             # marker restoration process. Markers will be handled by MainWindow.
 
-            # Clear old waveform data explicitly to release memory
-            if self.waveform_data is not None:
-                if isinstance(self.waveform_data, dict):
-                    # Clear multi-level format
-                    if "levels" in self.waveform_data:
-                        for level in self.waveform_data["levels"]:
-                            del level
-                    self.waveform_data.clear()
-                del self.waveform_data
-                self.waveform_data = None
+            # Drop the reference to the old waveform; the arrays may still be
+            # shared with the generator's cache, so they are never mutated
+            self.waveform_data = None
 
             # Clear cached surfaces explicitly to release memory
             if self.cached_waveform_surface is not None:
@@ -200,6 +215,9 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                         )
                 else:
                     # Old single-level format - wrap it for compatibility
+                    # (numpy is already loaded by the waveform generator)
+                    import numpy as np
+
                     self.waveform_data = np.asarray(data, dtype=np.float32)
                     samples_per_second = (
                         len(self.waveform_data) / duration if duration > 0 else 0
@@ -274,7 +292,10 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                         self.cached_viewport_key = None
                         self.cached_waveform_surface = None
 
-        self.queue_draw()
+        # Hidden (e.g. waveform panel collapsed): keep the state, skip the
+        # redraw; mapping the widget again draws the current position
+        if self.get_mapped():
+            self.queue_draw()
 
     def clear_waveform(self):
         """Clear the current waveform visualization when audio is removed."""
@@ -345,7 +366,7 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
             self.pan_gesture_active = True
             self.pan_gesture_start_x = x
             self.pan_gesture_start_offset = self.viewport_offset
-            self.set_cursor(Gdk.Cursor.new_from_name("grabbing"))
+            self.set_cursor(_named_cursor("grabbing"))
             return
 
         width = self.get_width()
@@ -460,7 +481,7 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                 self.pan_gesture_active = True
                 self.pan_gesture_start_x = start_x
                 self.pan_gesture_start_offset = self.viewport_offset
-                self.set_cursor(Gdk.Cursor.new_from_name("grabbing"))
+                self.set_cursor(_named_cursor("grabbing"))
                 return
 
         # If we have a potential segment drag, start tracking for REAL drag
@@ -886,13 +907,11 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
         # Set pointer cursor when over scrollbar
         if self.hovering_scrollbar:
             if self._is_over_scrollbar_thumb(x, y):
-                self.set_cursor(
-                    Gdk.Cursor.new_from_name("hand2")
-                )  # Hand cursor for draggable thumb
+                # Hand cursor for draggable thumb
+                self.set_cursor(_named_cursor("hand2"))
             else:
-                self.set_cursor(
-                    Gdk.Cursor.new_from_name("pointer")
-                )  # Pointer cursor for scrollbar track
+                # Pointer cursor for scrollbar track
+                self.set_cursor(_named_cursor("pointer"))
             return  # Exit early when over scrollbar
 
         # Calculate hover time position and trigger redraw for hover line display
@@ -932,7 +951,7 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                         event.get_modifier_state() & Gdk.ModifierType.CONTROL_MASK
                     ) != 0
                     if ctrl_pressed:
-                        self.set_cursor(Gdk.Cursor.new_from_name("grab"))
+                        self.set_cursor(_named_cursor("grab"))
                         return
             self.set_cursor(None)
             return
@@ -946,7 +965,7 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                 self.marker_mode == MarkerMode.CONFIRM
                 and self._check_confirm_buttons(x, y, just_check=True)
             ):
-                self.set_cursor(Gdk.Cursor.new_from_name("pointer"))
+                self.set_cursor(_named_cursor("pointer"))
                 return
             else:
                 self.set_cursor(None)
@@ -956,22 +975,22 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
         if not self.is_dragging_marker:
             # Check delete button hover
             if self.hovering_delete_button:
-                self.set_cursor(Gdk.Cursor.new_from_name("pointer"))
+                self.set_cursor(_named_cursor("pointer"))
                 return
 
             # Check marker edge for resize cursor
             marker_info = self._find_marker_at_position(x, y)
             if marker_info:
                 if marker_info["type"] == "start":
-                    self.set_cursor(Gdk.Cursor.new_from_name("w-resize"))
+                    self.set_cursor(_named_cursor("w-resize"))
                 else:
-                    self.set_cursor(Gdk.Cursor.new_from_name("e-resize"))
+                    self.set_cursor(_named_cursor("e-resize"))
                 return
 
             # Check segment body for move cursor
             segment_body_index = self._find_segment_body_at_position(x, y)
             if segment_body_index is not None:
-                self.set_cursor(Gdk.Cursor.new_from_name("move"))
+                self.set_cursor(_named_cursor("move"))
                 return
 
             # Update segment hover highlight
@@ -981,9 +1000,9 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
                 self.queue_draw()
 
             if pair_index >= 0:
-                self.set_cursor(Gdk.Cursor.new_from_name("pointer"))
+                self.set_cursor(_named_cursor("pointer"))
             else:
-                self.set_cursor(Gdk.Cursor.new_from_name("crosshair"))
+                self.set_cursor(_named_cursor("crosshair"))
 
     def connect_seek_handler(self, callback):
         """Connect a handler for seek events."""
@@ -1251,9 +1270,6 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
         cr.move_to(center_x - text_extents.width / 2, center_y + spinner_radius + 35)
         cr.show_text(self.loading_message)
 
-        # Queue another redraw to animate the spinner
-        GLib.timeout_add(50, self.queue_draw)  # Update at ~20 FPS
-
     def _select_waveform_level(self):
         """Select the appropriate waveform LOD level for current zoom.
 
@@ -1275,6 +1291,9 @@ class AudioVisualizer(MarkerManagerMixin, Gtk.DrawingArea):
 
     def _render_waveform_cache(self, width, height, visible_waveform, viewport_key):
         """Render the waveform to a cached ImageSurface."""
+        # Only reached with waveform data, so numpy is already imported
+        import numpy as np
+
         y_center = height / 2
         y_scale = height * 0.4
         render_width = int(width)
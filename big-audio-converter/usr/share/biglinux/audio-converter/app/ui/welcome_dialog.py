@@ -67,9 +67,6 @@ class WelcomeDialog:
         columns_box.set_hexpand(True)
 
         # Left column - Core features
-        left_column = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        left_column.set_hexpand(True)
-
         features = [
             (
                 "🎵 " + _("Play and Convert Audio"),
@@ -97,15 +94,7 @@ class WelcomeDialog:
             ),
         ]
 
-        for title, description in features:
-            left_column.append(self._create_feature_box(title, description))
-
-        columns_box.append(left_column)
-
         # Right column - Additional tools
-        right_column = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        right_column.set_hexpand(True)
-
         more_features = [
             (
                 "🔇 " + _("Noise Reduction"),
@@ -127,10 +116,8 @@ class WelcomeDialog:
             ),
         ]
 
-        for title, description in more_features:
-            right_column.append(self._create_feature_box(title, description))
-
-        columns_box.append(right_column)
+        for column_features in (features, more_features):
+            columns_box.append(self._create_feature_column(column_features))
 
         content_box.append(columns_box)
 
@@ -195,6 +182,14 @@ class WelcomeDialog:
         if self.dialog and self.parent_window:
             self.dialog.present(self.parent_window)
 
+    def _create_feature_column(self, features):
+        """Create a column of feature boxes from (title, description) pairs"""
+        column = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        column.set_hexpand(True)
+        for title, description in features:
+            column.append(self._create_feature_box(title, description))
+        return column
+
     def _create_feature_box(self, title, description):
         """Create a feature box with title and description"""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
@@ -15,6 +15,23 @@ _ = gettext.gettext
 logger = logging.getLogger(__name__)
 
 
+# Spellings the app itself writes; anything else falls back to casefold()
+_TRUE_SPELLINGS = frozenset({"true", "True", "TRUE"})
+
+
+def is_true(value):
+    """Return whether a stored config value means "enabled".
+
+    Booleans are saved as "true"/"false" strings (any letter case), but older
+    keys may hold real bools.
+    """
+    if value is True:
+        return True
+    if isinstance(value, str):
+        return value in _TRUE_SPELLINGS or value.casefold() == "true"
+    return False
+
+
 class AppConfig:
     """Manage application configuration settings."""
 
@@ -131,8 +148,37 @@ class AppConfig:
         """Get a configuration value."""
         return self.config.get(key, default)
 
+    def get_bool(self, key, default=False):
+        """Get a configuration value as a bool, accepting "true"/"false" strings."""
+        value = self.config.get(key)
+        if value is None:
+            return default
+        return is_true(value)
+
+    def get_many(self, keys):
+        """Return a dict of the given keys that have a stored value."""
+        config = self.config
+        return {key: config[key] for key in keys if key in config}
+
+    def snapshot(self, prefix=None):
+        """Return a plain dict copy of the settings, optionally filtered by key prefix."""
+        if prefix is None:
+            return dict(self.config)
+        return {k: v for k, v in self.config.items() if k.startswith(prefix)}
+
     def set(self, key, value):
-        """Set a configuration value with debounced save."""
+        """Set a configuration value with debounced save.
+
+        A value equal to this instance's in-memory copy is ignored, because
+        widgets echo restored values back through their change handlers.
+        Trade-off: the copy reflects the file as of the last load or save.
+        If another instance has since written a different value, setting
+        the key back to the value this instance still holds is not saved.
+        Keys this instance already modified are unaffected, because every
+        save rewrites them from memory.
+        """
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
         self.modified_keys.add(key)
         self._schedule_save()
@@ -0,0 +1,48 @@
+# app/utils/config_keys.py
+
+"""
+Names of the configuration keys shared by the code that saves and restores them.
+"""
+
+# Output
+CONVERSION_FORMAT = "conversion_format"
+CONVERSION_BITRATE = "conversion_bitrate"
+AUDIO_CHANNELS = "audio_channels"
+CONVERSION_VOLUME = "conversion_volume"
+CONVERSION_SPEED = "conversion_speed"
+
+# Noise reduction
+CONVERSION_NOISE_REDUCTION = "conversion_noise_reduction"
+NOISE_REDUCTION_STRENGTH = "noise_reduction_strength"
+NOISE_MODEL = "noise_model"
+NOISE_MODEL_BLEND = "noise_model_blend"
+NOISE_SPEECH_STRENGTH = "noise_speech_strength"
+NOISE_LOOKAHEAD = "noise_lookahead"
+NOISE_VOICE_ENHANCE = "noise_voice_enhance"
+
+# Dynamics and filters
+GATE_ENABLED = "gate_enabled"
+GATE_INTENSITY = "gate_intensity"
+COMPRESSOR_ENABLED = "compressor_enabled"
+COMPRESSOR_INTENSITY = "compressor_intensity"
+HPF_ENABLED = "hpf_enabled"
+HPF_FREQUENCY = "hpf_frequency"
+TRANSIENT_ENABLED = "transient_enabled"
+TRANSIENT_ATTACK = "transient_attack"
+NORMALIZE_ENABLED = "normalize_enabled"
+
+# Waveform and cutting
+GENERATE_WAVEFORMS = "generate_waveforms"
+CUT_AUDIO_ENABLED = "cut_audio_enabled"
+CUT_AUDIO_MODE = "cut_audio_mode"
+CUT_OUTPUT_MODE = "cut_output_mode"
+
+# Window layout
+SIDEBAR_WIDTH = "sidebar_width"
+VISUALIZER_HEIGHT = "visualizer_height"
+WINDOW_WIDTH = "window_width"
+WINDOW_HEIGHT = "window_height"
+WINDOW_MAXIMIZED = "window_maximized"
+
+# Playback
+AUTO_ADVANCE_ENABLED = "auto_advance_enabled"
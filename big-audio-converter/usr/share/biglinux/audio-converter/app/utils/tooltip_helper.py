@@ -26,6 +26,9 @@ _ = gettext.gettext
 
 logger = logging.getLogger(__name__)
 
+# "true" as written by the config (kept local so this module stays portable)
+_TRUE_SPELLINGS = frozenset({"true", "True", "TRUE"})
+
 # Tooltip content dictionary
 TOOLTIPS = {
     "format": _(
@@ -196,8 +199,12 @@ class TooltipHelper:
         """Check if tooltips are enabled in config."""
         if not self.config_manager:
             return True
-        enabled_str = self.config_manager.get("show_mouseover_tips", "true")
-        return enabled_str.lower() == "true"
+        enabled = self.config_manager.get("show_mouseover_tips", "true")
+        if enabled is True:
+            return True
+        if isinstance(enabled, str):
+            return enabled in _TRUE_SPELLINGS or enabled.casefold() == "true"
+        return False
 
     def _on_theme_changed(self, style_manager, pspec):
         """Auto-update colors when system theme changes."""
@@ -325,6 +332,11 @@ popover.custom-tooltip-static label {{
         widget._custom_tooltip_text = tooltip_text
         widget._custom_tooltip_y_offset = y_offset
         widget.set_tooltip_text(None)
+
+        # Re-applying (e.g. after toggling tips) only refreshes the text;
+        # controllers and window tracking are already attached
+        if widget in self._widgets_with_tooltips:
+            return
         self._add_controller(widget)
 
         # Track the widget for cleanup
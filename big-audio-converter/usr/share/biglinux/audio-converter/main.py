@@ -127,6 +127,19 @@ class Application(Adw.Application):
         welcome = WelcomeDialog(parent_window)
         welcome.present()
 
+    def do_shutdown(self):
+        """Stop background work so quitting never waits on a waveform decode."""
+        # app.quit (Ctrl+Q) skips the windows' close-request handlers
+        for window in self.get_windows():
+            if isinstance(window, MainWindow):
+                window.stop_background_work()
+        # Pool workers are joined at interpreter exit; end the running decode.
+        # Only loaded once a waveform was requested (it pulls in numpy).
+        waveform = sys.modules.get("app.audio.waveform")
+        if waveform is not None:
+            waveform.cancel_current()
+        Adw.Application.do_shutdown(self)
+
     def on_quit_action(self, *args):
         """Handle the app.quit action."""
         self.quit()
@@ -20,7 +20,7 @@ sys.path.insert(
     ),
 )
 
-from app.utils.config import AppConfig
+from app.utils.config import AppConfig, is_true
 
 
 @pytest.fixture
@@ -59,6 +59,39 @@ class TestAppConfigGetSet:
         config.set("default_format", "flac")
         assert config.get("default_format") == "flac"
 
+    def test_snapshot_is_detached_copy(self, config):
+        snap = config.snapshot()
+        assert snap == config.config
+        snap["default_format"] = "wav"
+        assert config.get("default_format") == "mp3"
+
+    def test_snapshot_prefix(self, config):
+        assert config.snapshot(prefix="default_") == {"default_format": "mp3"}
+
+    def test_get_bool_parses_strings(self, config):
+        config.set("flag_on", "true")
+        config.set("flag_off", "false")
+        assert config.get_bool("flag_on") is True
+        assert config.get_bool("flag_off", True) is False
+        assert config.get_bool("confirm_overwrite") is True
+
+    def test_is_true_matches_only_true_spellings(self):
+        assert is_true("true") and is_true("tRue") and is_true(True)
+        for value in ("1", "yes", "on", "false", 1, False, None):
+            assert not is_true(value)
+
+    def test_get_bool_default_for_missing(self, config):
+        assert config.get_bool("nonexistent", True) is True
+        assert config.get_bool("nonexistent") is False
+
+    def test_get_many_skips_missing_keys(self, config):
+        config.set("sidebar_width", "380")
+        keys = ("sidebar_width", "default_format", "nonexistent")
+        assert config.get_many(keys) == {
+            "sidebar_width": "380",
+            "default_format": "mp3",
+        }
+
 
 class TestAppConfigPersistence:
     def test_save_and_load(self, config):
@@ -76,6 +109,13 @@ class TestAppConfigPersistence:
         loaded = config.load_config()
         assert "default_format" in loaded
 
+    def test_set_unchanged_value_schedules_nothing(self, config):
+        # Compared with the in-memory copy only (see AppConfig.set): a value
+        # another instance wrote since the last load is not detected here
+        config.set("default_format", "mp3")
+        assert config.modified_keys == set()
+        assert config._save_timer is None
+
     def test_flush_saves_immediately(self, config):
         config.set("last_directory", "/tmp/test")
         config.flush()
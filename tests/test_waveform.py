@@ -0,0 +1,127 @@
+"""Unit tests for BAC WaveformGenerator caching."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "big-audio-converter",
+        "usr",
+        "share",
+        "biglinux",
+        "audio-converter",
+    ),
+)
+
+from app.audio import waveform
+
+
+class FakeVisualizer:
+    """Records shown waveforms; releases the previous payload like the real one."""
+
+    markers_enabled = False
+
+    def __init__(self):
+        self.waveform_data = None
+        self.shown = []
+
+    def set_loading(self, is_loading, message=None):
+        pass
+
+    def set_waveform(self, data, duration):
+        # A consumer is free to mutate the payload it was handed
+        if isinstance(self.waveform_data, dict):
+            self.waveform_data.clear()
+        self.waveform_data = data
+        self.shown.append((data, duration))
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """Create a WaveformGenerator whose main-loop callbacks run immediately."""
+    monkeypatch.setattr(waveform.GLib, "idle_add", lambda func, *args: func(*args))
+    return waveform.WaveformGenerator()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "song.wav"
+    path.write_bytes(b"RIFF")
+    return str(path)
+
+
+class TestResultCache:
+    def test_cached_entry_served_twice(self, generator, audio_file):
+        data = np.linspace(-1.0, 1.0, 100, dtype=np.float32)
+        cache_key = generator._cache_key(audio_file, audio_file)
+        generator._remember(cache_key, data, 8000, 1.5)
+
+        visualizer = FakeVisualizer()
+        for _ in range(2):
+            generator.generate(audio_file, None, visualizer)
+
+        (first, _), (second, duration) = visualizer.shown
+        assert first is not second
+        assert second["levels"][0] is data
+        assert second["rates"] == [8000]
+        assert duration == 1.5
+
+    def test_cached_array_is_read_only(self, generator, audio_file):
+        data = np.zeros(10, dtype=np.float32)
+        generator._remember(generator._cache_key(audio_file, audio_file), data, 200, 0.05)
+        with pytest.raises(ValueError):
+            data[0] = 1.0
+
+    def test_superseded_result_is_dropped(self, generator, audio_file):
+        data = np.zeros(10, dtype=np.float32)
+        visualizer = FakeVisualizer()
+        generator._latest_path = "/other/file.wav"
+        generator._show_waveform(visualizer, data, 200, 0.05, audio_file, None)
+        assert visualizer.shown == []
+
+
+class TestDiskCache:
+    def test_short_waveform_kept_whole(self, generator):
+        data = np.linspace(-1.0, 1.0, 1000, dtype=np.float32)
+        peaks, rate = generator._peaks_for_disk(data, 8000)
+        assert len(peaks) == 1000
+        assert rate == 8000.0
+
+    def test_long_waveform_reduced_to_min_max_pairs(self, generator, monkeypatch):
+        monkeypatch.setattr(generator, "DISK_CACHE_MAX_SAMPLES", 100)
+        data = np.sin(np.linspace(0, 20 * np.pi, 10_000)).astype(np.float32)
+        peaks, rate = generator._peaks_for_disk(data, 10_000)
+        assert len(peaks) <= 100
+        assert rate == pytest.approx(len(peaks) / 1.0)
+        assert peaks.min() == pytest.approx(data.min(), abs=1e-3)
+        assert peaks.max() == pytest.approx(data.max(), abs=1e-3)
+
+    def test_prune_keeps_recently_used(self, generator, tmp_path, monkeypatch):
+        monkeypatch.setattr(waveform, "PEAK_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(generator, "DISK_CACHE_MAX_BYTES", 250)
+        for age, name in enumerate(("new", "mid", "old")):
+            path = tmp_path / f"{name}.npz"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (1000 - age, 1000 - age))
+
+        generator._prune_disk_cache()
+
+        assert sorted(os.listdir(tmp_path)) == ["mid.npz", "new.npz"]
+
+    def test_prune_tolerates_files_removed_elsewhere(self, generator, tmp_path, monkeypatch):
+        monkeypatch.setattr(waveform, "PEAK_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(generator, "DISK_CACHE_MAX_BYTES", 150)
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.npz").write_bytes(b"x" * 100)
+
+        def vanished(path):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(waveform.os, "remove", vanished)
+        generator._prune_disk_cache()